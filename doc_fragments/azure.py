@@ -0,0 +1,102 @@
+# Copyright (c) 2016 Matt Davis, <mdavis@ansible.com>
+#                    Chris Houseknecht, <house@redhat.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment(object):
+
+    # Azure doc fragment, replaces the one shipped with Ansible for the modules of this role
+    DOCUMENTATION = '''
+
+options:
+    ad_user:
+        description:
+            - Active Directory username. Use when authenticating with an Active Directory user rather than service
+              principal.
+    password:
+        description:
+            - Active Directory username password. Use when authenticating with an Active Directory user rather than service
+              principal.
+    profile:
+        description:
+            - Security profile found in ~/.azure/credentials file.
+    subscription_id:
+        description:
+            - Your Azure subscription Id.
+    client_id:
+        description:
+            - Azure client ID. Use when authenticating with a Service Principal.
+    secret:
+        description:
+            - Azure client secret. Use when authenticating with a Service Principal.
+    tenant:
+        description:
+            - Azure tenant ID. Use when authenticating with a Service Principal.
+    cloud_environment:
+        description:
+            - For cloud environments other than the US public cloud, the environment name (as defined by Azure Python SDK, eg, C(AzureChinaCloud),
+              C(AzureUSGovernment)), or a metadata discovery endpoint URL (required for Azure Stack). Can also be set via credential file profile or
+              the C(AZURE_CLOUD_ENVIRONMENT) environment variable.
+        default: AzureCloud
+        version_added: 2.4
+    adfs_authority_url:
+        description:
+            - Azure AD authority url. Use when authenticating with Username/password, and has your own ADFS authority.
+        version_added: 2.6
+    cert_validation_mode:
+        description:
+            - Controls the certificate validation behavior for Azure endpoints. By default, all modules will validate the server certificate, but
+              when an HTTPS proxy is in use, or against Azure Stack, it may be necessary to disable this behavior by passing C(ignore). Can also be
+              set via credential file profile or the C(AZURE_CERT_VALIDATION) environment variable.
+        choices: [validate, ignore]
+        version_added: 2.5
+    auth_source:
+        description:
+            - Controls the source of the credentials to use for authentication.
+            - C(auto) will follow the default precedence of module parameters -> environment variables -> default profile in credential file
+              C(~/.azure/credentials).
+            - When set to C(cli), the credentials will be sources from the default Azure CLI profile.
+            - Can also be set via the C(ANSIBLE_AZURE_AUTH_SOURCE) environment variable.
+        choices:
+        - auto
+        - cli
+        - credential_file
+        - env
+        - msi
+        default: auto
+        version_added: 2.5
+    api_profile:
+        description:
+        - Selects an API profile to use when communicating with Azure services. Default value of C(latest) is appropriate for public clouds;
+          future values will allow use with Azure Stack.
+        default: latest
+        version_added: 2.5
+    poll_interval:
+        description:
+            - Seconds after which the status of a long running operation is checked first. Later checks back off exponentially with jitter up
+              to 15 seconds, unless Azure asks for a different interval with C(Retry-After).
+            - Defaults to 1 second.
+        type: float
+        version_added: 2.8
+    poll_timeout:
+        description:
+            - Seconds after which waiting for a long running operation fails. Waits until the operation completed if not set.
+        type: int
+        version_added: 2.8
+requirements:
+    - "python >= 2.7"
+    - "azure >= 2.0.0"
+
+notes:
+    - For authentication with Azure you can pass parameters, set environment variables or use a profile stored
+      in ~/.azure/credentials. Authentication is possible using a service principal or Active Directory user.
+      To authenticate via service principal, pass subscription_id, client_id, secret and tenant or set environment
+      variables AZURE_SUBSCRIPTION_ID, AZURE_CLIENT_ID, AZURE_SECRET and AZURE_TENANT.
+    - To authenticate via Active Directory user, pass ad_user and password, or set AZURE_AD_USER and
+      AZURE_PASSWORD in the environment.
+    - "Alternatively, credentials can be stored in ~/.azure/credentials. This is an ini file containing
+      a [default] section and the following keys: subscription_id, client_id, secret and tenant or
+      subscription_id, ad_user and password. It is also possible to add additional profiles. Specify the profile
+      by passing profile or setting AZURE_PROFILE in the environment."
+'''
@@ -0,0 +1,21 @@
+# Copyright (c) Ansible Project
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment(object):
+
+    # Azure doc fragment for facts modules
+    DOCUMENTATION = '''
+
+options:
+    fields:
+        description:
+            - List of fields to return for every item, as dotted paths, e.g. C(name) or C(properties.provisioningState).
+            - Paths follow the return structure of each module. Modules returning REST API objects use camelCase
+              paths below C(properties), e.g. C(properties.provisioningState). Modules returning SDK dicts use
+              snake_case paths without C(properties), e.g. C(provisioning_state) or C(site_config.always_on).
+            - Fields of SDK objects are only serialized if selected. All fields are returned if not specified.
+        type: list
+        version_added: 2.8
+'''
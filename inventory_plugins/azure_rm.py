@@ -0,0 +1,383 @@
+# Copyright (c) Ansible Project
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+    name: azure_rm
+    plugin_type: inventory
+    short_description: Azure Resource Manager inventory plugin
+    extends_documentation_fragment:
+      - constructed
+    description:
+      - Query virtual machines and virtual machine scale set instances with their network interfaces and public IP addresses.
+      - Every resource type is listed with one paged call per resource group or subscription, and the calls run concurrently.
+      - Results are cached on the controller, see I(cache_ttl) and I(refresh_resource_groups).
+      - Authentication works the same way as for the Azure modules of this role.
+      - Requires a YAML configuration file whose name ends with C(azure_rm.yml) or C(azure_rm.yaml).
+    options:
+      plugin:
+        description: Token that ensures this is a source file for the plugin.
+        required: True
+        choices: ['azure_rm']
+      auth_source:
+        description: Controls the source of the credentials to use for authentication, see the Azure modules.
+        choices: ['auto', 'cli', 'credential_file', 'env', 'msi']
+        env:
+          - name: ANSIBLE_AZURE_AUTH_SOURCE
+      profile:
+        description: Security profile found in ~/.azure/credentials file.
+      subscription_id:
+        description: Your Azure subscription Id.
+      client_id:
+        description: Azure client ID. Use when authenticating with a Service Principal.
+      secret:
+        description: Azure client secret. Use when authenticating with a Service Principal.
+      tenant:
+        description: Azure tenant ID. Use when authenticating with a Service Principal.
+      ad_user:
+        description: Active Directory username. Use when authenticating with an Active Directory user rather than service principal.
+      password:
+        description: Active Directory user password. Use when authenticating with an Active Directory user rather than service principal.
+      cloud_environment:
+        description: For cloud environments other than the US public cloud, the environment name or a metadata discovery endpoint URL.
+      cert_validation_mode:
+        description: Controls the certificate validation behavior for Azure endpoints.
+        choices: ['validate', 'ignore']
+      adfs_authority_url:
+        description: Azure AD authority url. Use when authenticating with Username/password, and has your own ADFS authority.
+      include_vm_resource_groups:
+        description: A list of resource group names to search for virtual machines. C('*') includes all resource groups in the subscription.
+        type: list
+        default: ['*']
+      include_vmss_resource_groups:
+        description: A list of resource group names to search for virtual machine scale sets. C('*') includes all resource groups in the subscription.
+        type: list
+        default: []
+      batch_concurrency:
+        description: Maximum number of list calls running at the same time.
+        type: int
+        default: 10
+      cache_ttl:
+        description:
+          - Seconds to keep the inventory in the controller cache, C(0) disables the cache.
+          - C(ansible-inventory --flush-cache) ignores the cache for one run.
+        type: int
+        default: 600
+        env:
+          - name: ANSIBLE_AZURE_INVENTORY_CACHE_TTL
+      refresh_resource_groups:
+        description:
+          - A list of resource group names to query again, while the hosts of all other resource groups are served from the cache.
+        type: list
+        default: []
+        env:
+          - name: ANSIBLE_AZURE_INVENTORY_REFRESH
+'''
+
+EXAMPLES = '''
+# The following host variables are always available:
+# id, name, resource_group, location, tags, vm_size, os_type, computer_name, image, provisioning_state,
+# network_interfaces, private_ipv4_addresses, public_ipv4_addresses, public_dns_hostnames, scale_set
+
+# sample 'myazuresub.azure_rm.yaml'
+plugin: azure_rm
+include_vm_resource_groups:
+  - ansible-inventory-test-rg
+include_vmss_resource_groups:
+  - '*'
+keyed_groups:
+  - prefix: tag
+    key: tags
+  - key: location
+groups:
+  linux: "os_type == 'Linux'"
+'''
+
+import os
+import sys
+import time
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+
+try:
+    from importlib.util import spec_from_file_location, module_from_spec
+except ImportError:
+    import imp
+    spec_from_file_location = None
+
+ROLE_MODULE_UTILS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'module_utils')
+
+
+def load_role_module_utils(name, imports=None):
+    '''
+    Load a module_utils file of this role under a private name. Ansible ships older copies of the Azure
+    module_utils, which may be imported in this process already, so the role's copies cannot be found by path.
+
+    :param name: file name without extension
+    :param imports: dict of ansible.module_utils names imported by the file to the modules to use, only while loading
+    :return: module
+    '''
+    imports = imports or dict()
+    private_name = '_azure_rm_inventory_{0}'.format(name)
+    path = os.path.join(ROLE_MODULE_UTILS, '{0}.py'.format(name))
+    saved = dict((module_name, sys.modules.get(module_name)) for module_name in imports)
+    sys.modules.update(imports)
+    try:
+        if spec_from_file_location:
+            spec = spec_from_file_location(private_name, path)
+            module = module_from_spec(spec)
+            sys.modules[private_name] = module
+            spec.loader.exec_module(module)
+        else:
+            module = imp.load_source(private_name, path)
+    finally:
+        for module_name, module_value in saved.items():
+            if module_value is None:
+                sys.modules.pop(module_name, None)
+            else:
+                sys.modules[module_name] = module_value
+    return module
+
+
+ROLE_MODULE_UTILS_EXC = None
+try:
+    azure_rm_cache = load_role_module_utils('azure_rm_cache')
+    azure_rm_common = load_role_module_utils('azure_rm_common', {'ansible.module_utils.azure_rm_cache': azure_rm_cache})
+    azure_rm_common_rest = load_role_module_utils('azure_rm_common_rest')
+    AzureRMFileCache = azure_rm_cache.AzureRMFileCache
+    cache_key = azure_rm_cache.cache_key
+    AzureRMAuth = azure_rm_common.AzureRMAuth
+    parallel_map = azure_rm_common.parallel_map
+    HAS_AZURE = azure_rm_common.HAS_AZURE
+    HAS_AZURE_EXC = azure_rm_common.HAS_AZURE_EXC
+    GenericRestClient = azure_rm_common_rest.GenericRestClient
+    if not hasattr(GenericRestClient, 'query_pages'):
+        raise ImportError("{0} lacks GenericRestClient.query_pages".format(azure_rm_common_rest.__file__))
+except Exception as exc:
+    ROLE_MODULE_UTILS_EXC = exc
+
+try:
+    from msrestazure.tools import parse_resource_id
+except ImportError:
+    # This is checked with HAS_AZURE
+    pass
+
+COMPUTE_API_VERSION = '2017-12-01'
+NETWORK_API_VERSION = '2017-11-01'
+# scale set network interfaces and public IP addresses are only available in this version
+VMSS_NETWORK_API_VERSION = '2017-03-30'
+
+AUTH_OPTIONS = ['auth_source', 'profile', 'subscription_id', 'client_id', 'secret', 'tenant', 'ad_user',
+                'password', 'cloud_environment', 'cert_validation_mode', 'adfs_authority_url']
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable):
+
+    NAME = 'azure_rm'
+
+    def __init__(self):
+        super(InventoryModule, self).__init__()
+        self._client = None
+        self._subscription_id = None
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(('azure_rm.yml', 'azure_rm.yaml'))
+        return False
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path)
+        self._read_config_data(path)
+
+        if ROLE_MODULE_UTILS_EXC:
+            raise AnsibleError("The azure_rm inventory plugin could not load the module_utils of its role from {0} - {1}".format(
+                ROLE_MODULE_UTILS, ROLE_MODULE_UTILS_EXC))
+        if not HAS_AZURE:
+            raise AnsibleError("The azure_rm inventory plugin requires the Azure Python SDK - {0}".format(HAS_AZURE_EXC))
+
+        auth = AzureRMAuth(fail_impl=self._fail, **dict((option, self.get_option(option)) for option in AUTH_OPTIONS))
+        self._subscription_id = auth.subscription_id
+        self._client = GenericRestClient(auth.azure_credentials, auth.subscription_id,
+                                         base_url=auth._cloud_environment.endpoints.resource_manager)
+
+        self.inventory.add_group('azure')
+        for host in self._get_hosts(cache):
+            self._add_host(host)
+
+    def _fail(self, msg, **kwargs):
+        raise AnsibleError(msg)
+
+    def _get_hosts(self, use_cache):
+        '''
+        Return all hosts, read from the controller cache where possible. The cache holds the hosts per
+        resource group; groups in refresh_resource_groups are queried again and replace their cached hosts.
+        The cache entry expires cache_ttl seconds after its oldest resource group was queried.
+        '''
+        ttl = self.get_option('cache_ttl') or 0
+        vm_groups = [name.lower() for name in self.get_option('include_vm_resource_groups') or []]
+        vmss_groups = [name.lower() for name in self.get_option('include_vmss_resource_groups') or []]
+
+        cache = AzureRMFileCache('inventory') if ttl > 0 else None
+        key = cache_key(self._subscription_id, ','.join(sorted(vm_groups)), ','.join(sorted(vmss_groups)))
+
+        groups = cache.get(key) if cache and use_cache else None
+        if groups is None:
+            groups = self._query_hosts(vm_groups, vmss_groups)
+        else:
+            refresh = [name.lower() for name in self.get_option('refresh_resource_groups') or []]
+            if refresh:
+                groups.update(self._query_hosts([name for name in refresh if name in vm_groups or '*' in vm_groups],
+                                                [name for name in refresh if name in vmss_groups or '*' in vmss_groups],
+                                                refresh))
+        if cache and groups:
+            cache.set(key, groups, expires_at=min(group['queried_at'] for group in groups.values()) + ttl)
+
+        hosts = []
+        for group in groups.values():
+            hosts.extend(group['hosts'])
+        return hosts
+
+    def _query_hosts(self, vm_groups, vmss_groups, resource_groups=None):
+        '''
+        Query the hosts of the given resource groups, '*' standing for the whole subscription.
+
+        :param resource_groups: resource groups to report even if they have no hosts
+        :return: dict of lower case resource group name to dict with queried_at and hosts
+        '''
+        queried_at = time.time()
+        groups = dict((name, dict(queried_at=queried_at, hosts=[])) for name in resource_groups or [])
+
+        # list scale sets first, their instances are listed together with the virtual machines
+        queries = []
+        for scope in self._scopes(vmss_groups):
+            queries.append((scope + '/providers/Microsoft.Compute/virtualMachineScaleSets', COMPUTE_API_VERSION))
+        scale_sets = self._list_all(queries)[0]
+
+        queries = []
+        for scope in self._scopes(vm_groups):
+            queries.append((scope + '/providers/Microsoft.Compute/virtualMachines', COMPUTE_API_VERSION))
+            queries.append((scope + '/providers/Microsoft.Network/networkInterfaces', NETWORK_API_VERSION))
+            queries.append((scope + '/providers/Microsoft.Network/publicIPAddresses', NETWORK_API_VERSION))
+        for scale_set in scale_sets:
+            queries.append((scale_set['id'] + '/virtualMachines', COMPUTE_API_VERSION))
+            queries.append((scale_set['id'] + '/networkInterfaces', VMSS_NETWORK_API_VERSION))
+            queries.append((scale_set['id'] + '/publicIPAddresses', VMSS_NETWORK_API_VERSION))
+        items, scale_set_ids = self._list_all(queries)
+
+        vms = []
+        nics = dict()
+        pips = dict()
+        for item, scale_set_id in zip(items, scale_set_ids):
+            resource_type = (item.get('type') or '').lower()
+            if resource_type.endswith('/networkinterfaces'):
+                nics[item['id'].lower()] = item
+            elif resource_type.endswith('/publicipaddresses'):
+                pips[item['id'].lower()] = item
+            elif resource_type.endswith('/virtualmachines'):
+                vms.append((item, scale_set_id))
+
+        for vm, scale_set_id in vms:
+            host = self._to_host(vm, scale_set_id, nics, pips)
+            groups.setdefault(host['resource_group'].lower(), dict(queried_at=queried_at, hosts=[]))['hosts'].append(host)
+        return groups
+
+    def _scopes(self, resource_groups):
+        if '*' in resource_groups:
+            return ['/subscriptions/{0}'.format(self._subscription_id)]
+        return ['/subscriptions/{0}/resourceGroups/{1}'.format(self._subscription_id, name) for name in resource_groups]
+
+    def _list_all(self, queries):
+        '''
+        Run list queries concurrently.
+
+        :param queries: list of (url, api_version)
+        :return: tuple of list of items and list of the scale set id each item was listed under, or None
+        '''
+        listed = parallel_map(self._list, queries, self.get_option('batch_concurrency'))
+        items = []
+        scale_set_ids = []
+        errors = []
+        for (url, api_version), (values, error) in zip(queries, listed):
+            if error:
+                errors.append(error)
+            scale_set_id = url.rsplit('/', 1)[0] if '/virtualmachinescalesets/' in url.lower() else None
+            items.extend(values)
+            scale_set_ids.extend([scale_set_id] * len(values))
+        if errors:
+            raise AnsibleError("Error listing Azure resources - {0}".format(', '.join(errors)))
+        return items, scale_set_ids
+
+    def _list(self, query):
+        # runs on a worker thread, errors are returned and raised by _list_all
+        url, api_version = query
+        values = []
+        try:
+            for page in self._client.query_pages(url, {'api-version': api_version}, None, [200, 404]):
+                values.extend(page.get('value') or [])
+        except Exception as exc:
+            return values, "{0}: {1}".format(url, str(exc))
+        return values, None
+
+    def _to_host(self, vm, scale_set_id, nics, pips):
+        properties = vm.get('properties') or dict()
+        storage_profile = properties.get('storageProfile') or dict()
+        os_profile = properties.get('osProfile') or dict()
+
+        host = dict(
+            id=vm['id'],
+            name=vm['name'],
+            resource_group=parse_resource_id(vm['id'])['resource_group'],
+            location=vm.get('location'),
+            tags=vm.get('tags') or dict(),
+            vm_size=(properties.get('hardwareProfile') or dict()).get('vmSize') or (vm.get('sku') or dict()).get('name'),
+            os_type=(storage_profile.get('osDisk') or dict()).get('osType'),
+            computer_name=os_profile.get('computerName'),
+            image=storage_profile.get('imageReference'),
+            provisioning_state=properties.get('provisioningState'),
+            scale_set=parse_resource_id(scale_set_id)['name'] if scale_set_id else None,
+            network_interfaces=[],
+            private_ipv4_addresses=[],
+            public_ipv4_addresses=[],
+            public_dns_hostnames=[]
+        )
+
+        for nic_reference in (properties.get('networkProfile') or dict()).get('networkInterfaces') or []:
+            nic = nics.get(nic_reference['id'].lower())
+            if not nic:
+                continue
+            host['network_interfaces'].append(nic['name'])
+            for ip_configuration in (nic.get('properties') or dict()).get('ipConfigurations') or []:
+                ip_properties = ip_configuration.get('properties') or dict()
+                if ip_properties.get('privateIPAddress'):
+                    host['private_ipv4_addresses'].append(ip_properties['privateIPAddress'])
+                pip = pips.get(((ip_properties.get('publicIPAddress') or dict()).get('id') or '').lower())
+                if not pip:
+                    continue
+                pip_properties = pip.get('properties') or dict()
+                if pip_properties.get('ipAddress'):
+                    host['public_ipv4_addresses'].append(pip_properties['ipAddress'])
+                if (pip_properties.get('dnsSettings') or dict()).get('fqdn'):
+                    host['public_dns_hostnames'].append(pip_properties['dnsSettings']['fqdn'])
+        return host
+
+    def _add_host(self, host):
+        hostname = host['name']
+        if hostname in self.inventory.hosts:
+            # names are only unique within a resource group
+            hostname = '{0}_{1}'.format(host['name'], host['resource_group'])
+        self.inventory.add_host(hostname, group='azure')
+
+        for name, value in host.items():
+            self.inventory.set_variable(hostname, name, value)
+        addresses = host['public_ipv4_addresses'] or host['private_ipv4_addresses']
+        if addresses:
+            self.inventory.set_variable(hostname, 'ansible_host', addresses[0])
+
+        strict = self.get_option('strict')
+        self._set_composite_vars(self.get_option('compose'), host, hostname, strict=strict)
+        self._add_host_to_composed_groups(self.get_option('groups'), host, hostname, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host, hostname, strict=strict)
@@ -89,6 +89,13 @@ options:
                 description:
                     - The secret password associated with the service principal.
                 required: true
+    wait:
+        description:
+            - Wait for the long running operation to complete.
+            - With C(no) the module returns right away with I(operation), use M(azure_rm_operation_facts) to poll it.
+        type: bool
+        default: yes
+        version_added: "2.8"
 
 extends_documentation_fragment:
     - azure
@@ -168,6 +175,17 @@ state:
            client_id: XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX
         tags: {}
         type: Microsoft.ContainerService/ManagedClusters
+operation:
+    description:
+        - Handle of the running operation, poll it with M(azure_rm_operation_facts).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample:
+        id: "/subscriptions/XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX/resourceGroups/Testing/providers/Microsoft.ContainerService/managedClusters/aks1"
+        method: PUT
+        api_version: "2018-03-31"
+        status_url: "https://management.azure.com/subscriptions/XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX/providers/\\
+                     Microsoft.ContainerService/locations/eastus/operations/..."
 '''
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 import base64
@@ -372,6 +390,10 @@ class AzureRMManagedCluster(AzureRMModuleBase):
                 type='dict',
                 options=service_principal_spec
             ),
+            wait=dict(
+                type='bool',
+                default=True
+            ),
         )
 
         self.resource_group = None
@@ -384,6 +406,7 @@ class AzureRMManagedCluster(AzureRMModuleBase):
         self.linux_profile = None
         self.agent_pool_profiles = None
         self.service_principal = None
+        self.wait = None
 
         required_if = [
             ('state', 'present', [
@@ -542,6 +565,8 @@ class AzureRMManagedCluster(AzureRMModuleBase):
 
         try:
             poller = self.containerservice_client.managed_clusters.create_or_update(self.resource_group, self.name, parameters)
+            if not self.wait:
+                self.exit_with_operation(poller)
             response = self.get_poller_result(poller)
             response.kube_config = self.get_aks_kubeconfig()
             return create_aks_dict(response)
@@ -559,6 +584,8 @@ class AzureRMManagedCluster(AzureRMModuleBase):
         try:
             poller = self.containerservice_client.managed_clusters.delete(
                 self.resource_group, self.name)
+            if not self.wait:
+                self.exit_with_operation(poller)
             self.get_poller_result(poller)
             return True
         except CloudError as e:
@@ -36,6 +36,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Yuwei Zhou (@yuwzho)"
@@ -37,6 +37,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Zim Kalinowski (@zikalino)"
@@ -75,7 +76,7 @@ routes:
                     sample: route1
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -113,7 +114,7 @@ class AzureRMRoutesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.route_table_name = None
         self.route_name = None
-        super(AzureRMRoutesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMRoutesFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -144,7 +145,7 @@ class AzureRMRoutesFacts(AzureRMModuleBase):
             self.log('Could not get facts for Routes.')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = project_fields(response.as_dict(), self.fields)
 
         return results
 
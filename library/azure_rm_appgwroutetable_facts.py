@@ -36,6 +36,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Zim Kalinowski (@zikalino)"
@@ -93,7 +94,7 @@ route_tables:
                     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -130,7 +131,7 @@ class AzureRMRouteTablesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.route_table_name = None
         self.expand = None
-        super(AzureRMRouteTablesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMRouteTablesFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -159,7 +160,7 @@ class AzureRMRouteTablesFacts(AzureRMModuleBase):
             self.log('Could not get facts for RouteTables.')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = project_fields(response.as_dict(), self.fields)
 
         return results
 
@@ -35,6 +35,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Julien Stroheker (@julienstroheker)"
@@ -70,7 +71,7 @@ azure_availabilityset:
     }]
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -137,10 +138,11 @@ class AzureRMAvailabilitySetFacts(AzureRMModuleBase):
             pass
 
         if item and self.has_tags(item.tags, self.tags):
-            avase = self.serialize_obj(item, AZURE_OBJECT_CLASS)
+            avase = self.serialize_obj(item, AZURE_OBJECT_CLASS, apply_fields=False)
             avase['name'] = item.name
             avase['type'] = item.type
             avase['sku'] = item.sku.name
+            avase = project_fields(avase, self.fields)
             result = [avase]
 
         return result
@@ -158,10 +160,11 @@ class AzureRMAvailabilitySetFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                avase = self.serialize_obj(item, AZURE_OBJECT_CLASS)
+                avase = self.serialize_obj(item, AZURE_OBJECT_CLASS, apply_fields=False)
                 avase['name'] = item.name
                 avase['type'] = item.type
                 avase['sku'] = item.sku.name
+                avase = project_fields(avase, self.fields)
                 results.append(avase)
 
         return results
@@ -32,6 +32,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Zim Kalinowski (@zikalino)"
@@ -93,7 +94,7 @@ container_groups:
                     contains:
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -125,7 +126,7 @@ class AzureRMContainerGroupsFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.container_group_name = None
-        super(AzureRMContainerGroupsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMContainerGroupsFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -156,7 +157,7 @@ class AzureRMContainerGroupsFacts(AzureRMModuleBase):
             self.log('Could not get facts for ContainerGroups.')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = project_fields(response.as_dict(), self.fields)
 
         return results
 
@@ -176,7 +177,7 @@ class AzureRMContainerGroupsFacts(AzureRMModuleBase):
 
         if response is not None:
             for item in response:
-                results[item.name] = item.as_dict()
+                results[item.name] = project_fields(item.as_dict(), self.fields)
 
         return results
 
@@ -32,6 +32,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Zim Kalinowski (@zikalino)"
@@ -125,7 +126,7 @@ registries:
                             sample: "2017-03-01T23:15:37.0707808Z"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -157,7 +158,7 @@ class AzureRMRegistriesFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.registry_name = None
-        super(AzureRMRegistriesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMRegistriesFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -188,7 +189,7 @@ class AzureRMRegistriesFacts(AzureRMModuleBase):
             self.log('Could not get facts for Registries.')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = project_fields(response.as_dict(), self.fields)
 
         return results
 
@@ -208,7 +209,7 @@ class AzureRMRegistriesFacts(AzureRMModuleBase):
 
         if response is not None:
             for item in response:
-                results[item.name] = item.as_dict()
+                results[item.name] = project_fields(item.as_dict(), self.fields)
 
         return results
 
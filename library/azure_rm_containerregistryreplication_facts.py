@@ -37,6 +37,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Zim Kalinowski (@zikalino)"
@@ -107,7 +108,7 @@ replications:
                             sample: "2017-03-01T23:15:37.0707808Z"
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -145,7 +146,7 @@ class AzureRMReplicationsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.registry_name = None
         self.replication_name = None
-        super(AzureRMReplicationsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMReplicationsFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -176,7 +177,7 @@ class AzureRMReplicationsFacts(AzureRMModuleBase):
             self.log('Could not get facts for Replications.')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = project_fields(response.as_dict(), self.fields)
 
         return results
 
@@ -76,6 +76,7 @@ options:
   wait_for_deployment_completion:
     description:
       - Whether or not to block until the deployment has completed.
+      - With C(no) the module returns right away with I(operation), use M(azure_rm_operation_facts) to poll it.
     type: bool
     default: 'yes'
   wait_for_deployment_polling_period:
@@ -357,6 +358,16 @@ deployment:
         description: Dictionary of outputs received from the deployment
         type: dict
         returned: always
+operation:
+  description:
+    - Handle of the running deployment, poll it with M(azure_rm_operation_facts).
+  returned: when I(wait_for_deployment_completion=no)
+  type: dict
+  sample:
+    id: "/subscriptions/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx/resourcegroups/dev-ops-cle/providers/Microsoft.Resources/deployments/ansible-arm"
+    method: PUT
+    api_version: "2017-05-10"
+    status_url: "https://management.azure.com/subscriptions/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx/resourcegroups/dev-ops-cle/providers/..."
 '''
 
 import time
@@ -495,7 +506,9 @@ class AzureRMDeploymentManager(AzureRMModuleBase):
                                                                  deploy_parameter)
 
             deployment_result = None
-            if self.wait_for_deployment_completion:
+            if not self.wait_for_deployment_completion:
+                self.results['operation'] = self.get_operation_handle(result)
+            else:
                 deployment_result = self.get_poller_result(result)
                 while deployment_result.properties is None or deployment_result.properties.provisioning_state not in ['Canceled', 'Failed', 'Deleted',
                                                                                                                       'Succeeded']:
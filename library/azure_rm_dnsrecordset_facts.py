@@ -42,6 +42,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
     - azure_tags
 
 author:
@@ -130,7 +131,7 @@ class AzureRMRecordSetFacts(AzureRMModuleBase):
         self.record_type = None
         self.top = None
 
-        super(AzureRMRecordSetFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMRecordSetFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
 
@@ -36,6 +36,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
     - azure_tags
 
 author:
@@ -108,7 +109,7 @@ class AzureRMDNSZoneFacts(AzureRMModuleBase):
         self.resource_group = None
         self.tags = None
 
-        super(AzureRMDNSZoneFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMDNSZoneFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
 
@@ -35,6 +35,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Thomas Stringer (@tstringer)"
@@ -54,6 +55,14 @@ EXAMPLES = '''
       azure_rm_functionapp_facts:
         tags:
           - testing
+
+    - name: Get only whether Always On is set for a Function App
+      azure_rm_functionapp_facts:
+        resource_group: ansible-rg
+        name: myfunctionapp
+        fields:
+          - name
+          - site_config.always_on
 '''
 
 RETURN = '''
@@ -104,7 +113,7 @@ except:
     # This is handled in azure_rm_common
     pass
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 
 class AzureRMFunctionAppFacts(AzureRMModuleBase):
@@ -162,7 +171,7 @@ class AzureRMFunctionAppFacts(AzureRMModuleBase):
             pass
 
         if function_app and self.has_tags(function_app.tags, self.tags):
-            result = function_app.as_dict()
+            result = project_fields(function_app.as_dict(), self.fields)
 
         return [result]
 
@@ -176,7 +185,7 @@ class AzureRMFunctionAppFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                results.append(item.as_dict())
+                results.append(project_fields(item.as_dict(), self.fields))
         return results
 
     def list_all(self):
@@ -189,7 +198,7 @@ class AzureRMFunctionAppFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                results.append(item.as_dict())
+                results.append(project_fields(item.as_dict(), self.fields))
         return results
 
 
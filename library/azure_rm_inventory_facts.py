@@ -0,0 +1,242 @@
+#!/usr/bin/python
+#
+# Copyright (c) Ansible Project
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_inventory_facts
+version_added: "2.8"
+short_description: Get a compact inventory of all resources in a subscription.
+description:
+  - List the resources of a subscription or resource group in one pass, across all resource types.
+  - Pages are streamed by following C(nextLink) and reduced to a compact form while they arrive.
+  - With I(resource_types) every type is listed by its own query, running at most I(concurrency) queries at the same time.
+
+options:
+  resource_group:
+    description:
+      - Limit the inventory to a resource group.
+  resource_types:
+    description:
+      - List of resource types to include, e.g. C(Microsoft.Compute/virtualMachines).
+      - Filtered by Azure. All resource types are included if not specified.
+    type: list
+  tags:
+    description:
+      - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+      - A single tag without I(resource_types) is filtered by Azure, otherwise tags are matched locally.
+    type: list
+  concurrency:
+    description:
+      - Maximum number of resource types queried at the same time.
+    type: int
+    default: 5
+  api_version:
+    description:
+      - Version of the resources list API.
+    default: "2018-05-01"
+
+extends_documentation_fragment:
+  - azure
+  - azure_facts
+
+author:
+  - "Ansible Project"
+
+'''
+
+EXAMPLES = '''
+  - name: Get all resources of a subscription
+    azure_rm_inventory_facts:
+
+  - name: Get virtual machines, network interfaces and public IPs of a resource group
+    azure_rm_inventory_facts:
+      resource_group: Testing
+      resource_types:
+        - Microsoft.Compute/virtualMachines
+        - Microsoft.Network/networkInterfaces
+        - Microsoft.Network/publicIPAddresses
+
+  - name: Get all resources tagged for production
+    azure_rm_inventory_facts:
+      tags:
+        - env:production
+'''
+
+RETURN = '''
+resources:
+    description: Resources, in the order returned by Azure, grouped by I(resource_types) if specified.
+    returned: always
+    type: complex
+    contains:
+        id:
+            description: Resource ID.
+            type: str
+            sample: /subscriptions/xxxx/resourceGroups/Testing/providers/Microsoft.Network/publicIPAddresses/pip001
+        name:
+            description: Resource name.
+            type: str
+            sample: pip001
+        type:
+            description: Resource type.
+            type: str
+            sample: Microsoft.Network/publicIPAddresses
+        resource_group:
+            description: Resource group of the resource.
+            type: str
+            sample: Testing
+        location:
+            description: Location of the resource.
+            type: str
+            sample: eastus
+        tags:
+            description: Tags of the resource.
+            type: dict
+            sample: { "env": "production" }
+        kind:
+            description: Kind of the resource, if any.
+            type: str
+        sku:
+            description: SKU name of the resource, if any.
+            type: str
+            sample: Standard_LRS
+        managed_by:
+            description: ID of the resource managing this resource, if any.
+            type: str
+'''
+
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, parallel_map, project_fields
+from ansible.module_utils.azure_rm_common_rest import GenericRestClient
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+    from msrestazure.tools import parse_resource_id
+
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+
+class AzureRMInventoryFacts(AzureRMModuleBase):
+    def __init__(self):
+        # define user inputs into argument
+        self.module_arg_spec = dict(
+            resource_group=dict(
+                type='str'
+            ),
+            resource_types=dict(
+                type='list'
+            ),
+            tags=dict(
+                type='list'
+            ),
+            concurrency=dict(
+                type='int',
+                default=5
+            ),
+            api_version=dict(
+                type='str',
+                default='2018-05-01'
+            )
+        )
+        # store the results of the module operation
+        self.results = dict(
+            changed=False,
+            resources=[]
+        )
+        self.mgmt_client = None
+        self.resource_group = None
+        self.resource_types = None
+        self.tags = None
+        self.concurrency = None
+        self.api_version = None
+        super(AzureRMInventoryFacts, self).__init__(self.module_arg_spec, supports_tags=False, facts_module=True)
+
+    def exec_module(self, **kwargs):
+        for key in self.module_arg_spec:
+            setattr(self, key, kwargs[key])
+        self.mgmt_client = self.get_mgmt_svc_client(GenericRestClient,
+                                                    base_url=self._cloud_environment.endpoints.resource_manager)
+
+        url = '/subscriptions/{0}'.format(self.subscription_id)
+        if self.resource_group:
+            url += '/resourceGroups/{0}'.format(self.resource_group)
+        url += '/resources'
+
+        if self.resource_types:
+            # Azure does not combine resource type and tag filters, tags are matched locally
+            filters = ["resourceType eq '{0}'".format(resource_type) for resource_type in self.resource_types]
+        else:
+            filters = [self.get_tag_filter(self.tags)]
+
+        listed = parallel_map(lambda resource_filter: self.list_resources(url, resource_filter, self.tags),
+                              filters, self.concurrency)
+
+        errors = []
+        for resources, error in listed:
+            self.results['resources'].extend(resources)
+            if error:
+                errors.append(error)
+        if errors:
+            self.fail("Error listing resources - {0}".format(', '.join(errors)), resources=self.results['resources'])
+        return self.results
+
+    def list_resources(self, url, resource_filter, tags):
+        '''
+        List the resources matching a filter. Runs on a worker thread, so errors are returned instead of failing.
+
+        :return: tuple of list of compact resources and error message or None
+        '''
+        query_parameters = {'api-version': self.api_version}
+        if resource_filter:
+            query_parameters['$filter'] = resource_filter
+        header_parameters = {'Content-Type': 'application/json; charset=utf-8'}
+
+        resources = []
+        try:
+            # prefetch only a single query, type queries already overlap with each other
+            pages = self.mgmt_client.query_pages(url, query_parameters, header_parameters, [200, 404],
+                                                 prefetch=2 if len(self.resource_types or []) <= 1 else 0)
+            for page in pages:
+                for item in page.get('value') or []:
+                    if tags and not self.has_tags(item.get('tags'), tags):
+                        continue
+                    resources.append(project_fields(self.to_compact(item), self.fields))
+        except CloudError as exc:
+            return resources, "{0}: {1}".format(resource_filter or url, exc.message)
+        except Exception as exc:
+            return resources, "{0}: {1}".format(resource_filter or url, str(exc))
+        return resources, None
+
+    def to_compact(self, item):
+        sku = item.get('sku')
+        return dict(
+            id=item.get('id'),
+            name=item.get('name'),
+            type=item.get('type'),
+            resource_group=parse_resource_id(item['id']).get('resource_group') if item.get('id') else None,
+            location=item.get('location'),
+            tags=item.get('tags') or dict(),
+            kind=item.get('kind'),
+            sku=sku.get('name') if isinstance(sku, dict) else None,
+            managed_by=item.get('managedBy')
+        )
+
+
+def main():
+    AzureRMInventoryFacts()
+
+
+if __name__ == '__main__':
+    main()
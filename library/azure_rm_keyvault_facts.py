@@ -35,6 +35,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Zim Kalinowski (@zikalino)"
@@ -71,7 +72,7 @@ vaults:
                     sample: id
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -107,7 +108,7 @@ class AzureRMVaultsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.vault_name = None
         self.top = None
-        super(AzureRMVaultsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMVaultsFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -138,7 +139,7 @@ class AzureRMVaultsFacts(AzureRMModuleBase):
             self.log('Could not get facts for Vaults.')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = project_fields(response.as_dict(), self.fields)
 
         return results
 
@@ -158,7 +159,7 @@ class AzureRMVaultsFacts(AzureRMModuleBase):
 
         if response is not None:
             for item in response:
-                results[item.name] = item.as_dict()
+                results[item.name] = project_fields(item.as_dict(), self.fields)
 
         return results
 
@@ -50,6 +50,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Thomas Stringer (@tstringer)"
@@ -47,6 +47,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
     - azure_tags
 
 author:
@@ -75,7 +76,7 @@ azure_managed_disk:
     type: list
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -132,7 +133,8 @@ class AzureRMManagedDiskFacts(AzureRMModuleBase):
         super(AzureRMManagedDiskFacts, self).__init__(
             derived_arg_spec=self.module_arg_spec,
             supports_check_mode=True,
-            supports_tags=True)
+            supports_tags=True,
+            facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -158,7 +160,7 @@ class AzureRMManagedDiskFacts(AzureRMModuleBase):
             pass
 
         if item and self.has_tags(item.tags, self.tags):
-            result = [managed_disk_to_dict(item)]
+            result = [project_fields(managed_disk_to_dict(item), self.fields)]
 
         return result
 
@@ -172,7 +174,7 @@ class AzureRMManagedDiskFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                results.append(managed_disk_to_dict(item))
+                results.append(project_fields(managed_disk_to_dict(item), self.fields))
         return results
 
 
@@ -43,6 +43,14 @@ options:
     source:
         description:
             - Source of the configuration.
+    state:
+        description:
+            - Assert the state of the Configuration. Use C(absent) to reset it to the default value of the server, as
+              server configurations cannot be deleted.
+        default: present
+        choices:
+            - absent
+            - present
 
 extends_documentation_fragment:
     - azure
@@ -71,7 +79,6 @@ id:
             ent_scheduler"
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -162,7 +169,8 @@ class AzureRMConfigurations(AzureRMModuleBase):
         else:
             self.log("Configuration instance already exists")
             if self.state == 'absent':
-                self.to_do = Actions.Delete
+                if old_response.get('value') != old_response.get('default_value'):
+                    self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Configuration instance has to be deleted or may be updated")
                 self.to_do = Actions.Update
@@ -188,11 +196,8 @@ class AzureRMConfigurations(AzureRMModuleBase):
             if self.check_mode:
                 return self.results
 
-            self.delete_configuration()
-            # make sure instance is actually deleted, for some Azure resources, instance is hanging around
-            # for some time after deletion -- this should be really fixed in Azure
-            while self.get_configuration():
-                time.sleep(20)
+            # a configuration is never removed, resetting it completes with the returned poller
+            self.delete_configuration(old_response)
         else:
             self.log("Configuration instance unchanged")
             self.results['changed'] = False
@@ -225,15 +230,21 @@ class AzureRMConfigurations(AzureRMModuleBase):
             self.fail("Error creating the Configuration instance: {0}".format(str(exc)))
         return response.as_dict()
 
-    def delete_configuration(self):
+    def delete_configuration(self, old_response):
         '''
-        Deletes specified Configuration instance in the specified subscription and resource group.
+        Resets specified Configuration instance to its default value.
 
         :return: True
         '''
         self.log("Deleting the Configuration instance {0}".format(self.name))
         try:
-            response = self.mgmt_client.configurations.delete()
+            response = self.mgmt_client.configurations.create_or_update(resource_group_name=self.resource_group,
+                                                                        server_name=self.server_name,
+                                                                        configuration_name=self.name,
+                                                                        value=old_response.get('default_value'),
+                                                                        source='system-default')
+            if isinstance(response, LROPoller):
+                self.get_poller_result(response)
         except CloudError as e:
             self.log('Error attempting to delete the Configuration instance.')
             self.fail("Error deleting the Configuration instance: {0}".format(str(e)))
@@ -36,6 +36,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Zim Kalinowski (@zikalino)"
@@ -104,7 +105,7 @@ configurations:
                     sample: system-default
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -141,7 +142,7 @@ class AzureRMConfigurationsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.server_name = None
         self.configuration_name = None
-        super(AzureRMConfigurationsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMConfigurationsFacts, self).__init__(self.module_arg_spec, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -175,7 +176,7 @@ class AzureRMConfigurationsFacts(AzureRMModuleBase):
             self.log('Could not get facts for Configurations.')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = project_fields(response.as_dict(), self.fields)
 
         return results
 
@@ -196,7 +197,7 @@ class AzureRMConfigurationsFacts(AzureRMModuleBase):
 
         if response is not None:
             for item in response:
-                results[item.name] = item.as_dict()
+                results[item.name] = project_fields(item.as_dict(), self.fields)
 
         return results
 
@@ -0,0 +1,217 @@
+#!/usr/bin/python
+#
+# Copyright (c) Ansible Project
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_operation_facts
+version_added: "2.8"
+short_description: Get the status of Azure long running operations.
+description:
+  - Poll the status of operations started by modules called with C(wait=no), e.g. M(azure_rm_aks),
+    M(azure_rm_virtualmachine_scaleset), M(azure_rm_sqldatabase) or M(azure_rm_deployment).
+  - Many operations are polled in one call.
+
+options:
+  operations:
+    description:
+      - List of operation handles as returned in C(operation) by the modules.
+    required: yes
+    type: list
+  concurrency:
+    description:
+      - Maximum number of operations polled at the same time.
+    type: int
+    default: 10
+  wait:
+    description:
+      - Wait until all operations completed.
+      - Uses I(poll_interval) with exponential backoff, and fails after I(poll_timeout) seconds if set.
+    type: bool
+    default: no
+
+extends_documentation_fragment:
+  - azure
+  - azure_facts
+
+author:
+  - "Ansible Project"
+
+'''
+
+EXAMPLES = '''
+  - name: Start creating clusters
+    azure_rm_aks:
+      name: "{{ item }}"
+      resource_group: Testing
+      dns_prefix: "{{ item }}"
+      linux_profile: "{{ linux_profile }}"
+      service_principal: "{{ service_principal }}"
+      agent_pool_profiles: "{{ agent_pool_profiles }}"
+      wait: no
+    with_items: "{{ clusters }}"
+    register: started
+
+  - name: Wait until all clusters are created
+    azure_rm_operation_facts:
+      operations: "{{ started.results | selectattr('operation', 'defined') | map(attribute='operation') | list }}"
+      wait: yes
+'''
+
+RETURN = '''
+operations:
+    description: Status of every operation, in the order of I(operations).
+    returned: always
+    type: complex
+    contains:
+        id:
+            description: Resource ID of the operation target.
+            type: str
+        status:
+            description:
+                - C(InProgress), C(Succeeded), C(Failed) or C(Canceled).
+                - C(Unknown) if Azure returned a status that could not be read, the operation is not done then.
+            type: str
+        done:
+            description: Whether the operation reached a final status.
+            type: bool
+        error:
+            description: Error details of a failed operation.
+            type: dict
+done:
+    description: Whether all operations reached a final status.
+    returned: always
+    type: bool
+'''
+
+import time
+
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, parallel_map, project_fields, next_poll_delay
+from ansible.module_utils.azure_rm_common_rest import GenericRestClient
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+    import json
+
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+
+FINAL_STATES = ['Succeeded', 'Failed', 'Canceled']
+
+
+class AzureRMOperationFacts(AzureRMModuleBase):
+    def __init__(self):
+        # define user inputs into argument
+        self.module_arg_spec = dict(
+            operations=dict(
+                type='list',
+                required=True
+            ),
+            concurrency=dict(
+                type='int',
+                default=10
+            ),
+            wait=dict(
+                type='bool',
+                default=False
+            )
+        )
+        # store the results of the module operation
+        self.results = dict(
+            operations=[],
+            done=False
+        )
+        self.mgmt_client = None
+        self.operations = None
+        self.concurrency = None
+        self.wait = None
+        super(AzureRMOperationFacts, self).__init__(self.module_arg_spec, supports_tags=False, facts_module=True)
+
+    def exec_module(self, **kwargs):
+        for key in self.module_arg_spec:
+            setattr(self, key, kwargs[key])
+        self.mgmt_client = self.get_mgmt_svc_client(GenericRestClient,
+                                                    base_url=self._cloud_environment.endpoints.resource_manager)
+
+        for operation in self.operations:
+            if not isinstance(operation, dict) or not (operation.get('status_url') or operation.get('id')):
+                self.fail("Every operation must be a dict with a status_url or an id, found {0}".format(operation))
+
+        results = [dict(id=operation.get('id'), status='InProgress', done=False, error=None) for operation in self.operations]
+        deadline = time.time() + self.poll_timeout if self.poll_timeout else None
+        delay = self.poll_interval
+        while True:
+            pending = [i for i, result in enumerate(results) if not result['done']]
+            polled = parallel_map(self.get_status, [self.operations[i] for i in pending], self.concurrency)
+            for i, result in zip(pending, polled):
+                results[i] = result
+            if not self.wait or all(result['done'] for result in results):
+                break
+            if deadline is not None and time.time() >= deadline:
+                self.fail("Timed out after {0} seconds waiting for the operations to complete".format(self.poll_timeout),
+                          operations=results, done=False)
+            # the last wait ends at the deadline, followed by a final check
+            time.sleep(delay if deadline is None else max(min(delay, deadline - time.time()), 0))
+            delay = next_poll_delay(delay)
+
+        self.results['operations'] = project_fields(results, self.fields)
+        self.results['done'] = all(result['done'] for result in results)
+        return self.results
+
+    def get_status(self, operation):
+        result = dict(id=operation.get('id'), status='InProgress', done=False, error=None)
+        try:
+            if operation.get('status_url'):
+                # Azure-AsyncOperation returns a status document, Location returns 202 until the operation completed
+                response = self.mgmt_client.query(operation['status_url'], 'GET', {}, None, None, [200, 201, 202, 204])
+                body = json.loads(response.text) if response.text else dict()
+                if response.status_code == 202:
+                    result['status'] = 'InProgress'
+                elif isinstance(body, dict) and body.get('status'):
+                    result['status'] = body['status']
+                    result['error'] = body.get('error')
+                else:
+                    result['status'] = 'Succeeded'
+            else:
+                query_parameters = {'api-version': operation.get('api_version')}
+                response = self.mgmt_client.query(operation['id'], 'GET', query_parameters, None, None, [200, 404])
+                if response.status_code == 404:
+                    result['status'] = 'Succeeded' if operation.get('method') == 'DELETE' else 'Failed'
+                else:
+                    body = json.loads(response.text)
+                    if operation.get('method') == 'DELETE':
+                        result['status'] = 'InProgress'
+                    else:
+                        result['status'] = (body.get('properties') or dict()).get('provisioningState') or 'Succeeded'
+        except ValueError:
+            # not a status document, e.g. an error page of a proxy; polled again with wait
+            result['status'] = 'Unknown'
+        except CloudError as exc:
+            result['status'] = 'Failed'
+            result['error'] = dict(message=exc.message)
+        except Exception as exc:
+            result['status'] = 'Failed'
+            result['error'] = dict(message=str(exc))
+        result['done'] = result['status'] in FINAL_STATES
+        return result
+
+
+def main():
+    AzureRMOperationFacts()
+
+
+if __name__ == '__main__':
+    main()
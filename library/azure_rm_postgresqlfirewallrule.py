@@ -71,7 +71,6 @@ id:
             s/rule1"
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -194,8 +193,7 @@ class AzureRMFirewallRules(AzureRMModuleBase):
             self.delete_firewallrule()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_firewallrule():
-                time.sleep(20)
+            self.wait_until_gone(self.get_firewallrule, self.name)
         else:
             self.log("Firewall Rule instance unchanged")
             self.results['changed'] = False
@@ -38,6 +38,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Chris Houseknecht (@chouseknecht)"
@@ -81,7 +82,7 @@ except:
     # This is handled in azure_rm_common
     pass
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 AZURE_OBJECT_CLASS = 'PublicIp'
 
@@ -137,9 +138,10 @@ class AzureRMPublicIPFacts(AzureRMModuleBase):
             pass
 
         if item and self.has_tags(item.tags, self.tags):
-            pip = self.serialize_obj(item, AZURE_OBJECT_CLASS)
+            pip = self.serialize_obj(item, AZURE_OBJECT_CLASS, apply_fields=False)
             pip['name'] = item.name
             pip['type'] = item.type
+            pip = project_fields(pip, self.fields)
             result = [pip]
 
         return result
@@ -154,9 +156,10 @@ class AzureRMPublicIPFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                pip = self.serialize_obj(item, AZURE_OBJECT_CLASS)
+                pip = self.serialize_obj(item, AZURE_OBJECT_CLASS, apply_fields=False)
                 pip['name'] = item.name
                 pip['type'] = item.type
+                pip = project_fields(pip, self.fields)
                 results.append(pip)
         return results
 
@@ -170,9 +173,10 @@ class AzureRMPublicIPFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                pip = self.serialize_obj(item, AZURE_OBJECT_CLASS)
+                pip = self.serialize_obj(item, AZURE_OBJECT_CLASS, apply_fields=False)
                 pip['name'] = item.name
                 pip['type'] = item.type
+                pip = project_fields(pip, self.fields)
                 results.append(pip)
         return results
 
@@ -30,7 +30,7 @@ options:
   api_version:
     description:
       - Specific API version to be used.
-    required: yes
+      - Required unless every item in I(batch) specifies its own C(api_version).
   provider:
     description:
       - Provider type.
@@ -85,6 +85,45 @@ options:
     choices:
         - absent
         - present
+  batch:
+    description:
+      - List of requests to run in one task instead of a single I(url).
+      - Requests share one REST client and run with bounded concurrency, every request is reported separately.
+      - The module fails after all requests completed if any of them failed.
+    type: list
+    suboptions:
+      url:
+        description:
+          - Azure RM Resource URL.
+        required: yes
+      method:
+        description:
+          - The HTTP method, defaults to I(method). C(DELETE) if I(state=absent).
+      body:
+        description:
+          - The body of the request.
+      api_version:
+        description:
+          - API version, defaults to I(api_version).
+      idempotency:
+        description:
+          - Idempotency check for this request, defaults to I(idempotency).
+        type: bool
+      state:
+        description:
+          - State of this resource, defaults to I(state).
+        choices:
+          - absent
+          - present
+      status_code:
+        description:
+          - Expected status codes, defaults to I(status_code).
+        type: list
+  batch_concurrency:
+    description:
+      - Maximum number of I(batch) requests in flight at the same time.
+    type: int
+    default: 5
 
 extends_documentation_fragment:
   - azure
@@ -103,16 +142,46 @@ EXAMPLES = '''
       resource_name: "{{ scaleset_name }}"
       api_version: "2017-12-01"
       body: "{{ body }}"
+
+  - name: Create many security rules in one task
+    azure_rm_resource:
+      api_version: "2017-11-01"
+      idempotency: yes
+      batch:
+        - url: "{{ nsg_id }}/securityRules/rule1"
+          body: "{{ rule1 }}"
+        - url: "{{ nsg_id }}/securityRules/rule2"
+          body: "{{ rule2 }}"
 '''
 
 RETURN = '''
 response:
     description: Response specific to resource type.
-    returned: always
+    returned: when I(batch) is not used
     type: dict
+results:
+    description: Outcome of every I(batch) request, in the order of I(batch).
+    returned: when I(batch) is used
+    type: complex
+    contains:
+        url:
+            description: Request URL.
+            type: str
+        changed:
+            description: Whether the resource was changed.
+            type: bool
+        failed:
+            description: Whether the request failed.
+            type: bool
+        msg:
+            description: Error message of a failed request.
+            type: str
+        response:
+            description: Response specific to resource type.
+            type: dict
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, parallel_map
 from ansible.module_utils.azure_rm_common_rest import GenericRestClient
 from copy import deepcopy
 
@@ -152,8 +221,7 @@ class AzureRMResource(AzureRMModuleBase):
                 default=[]
             ),
             api_version=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             method=dict(
                 type='str',
@@ -175,6 +243,13 @@ class AzureRMResource(AzureRMModuleBase):
                 type='str',
                 default='present',
                 choices=['present', 'absent']
+            ),
+            batch=dict(
+                type='list'
+            ),
+            batch_concurrency=dict(
+                type='int',
+                default=5
             )
         )
         # store the results of the module operation
@@ -197,6 +272,8 @@ class AzureRMResource(AzureRMModuleBase):
         self.idempotency = False
         self.state = None
         self.body = None
+        self.batch = None
+        self.batch_concurrency = None
         super(AzureRMResource, self).__init__(self.module_arg_spec, supports_tags=False)
 
     def exec_module(self, **kwargs):
@@ -205,9 +282,11 @@ class AzureRMResource(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(GenericRestClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        if self.state == 'absent':
-            self.method = 'DELETE'
-            self.status_code.append(204)
+        if self.batch:
+            return self.exec_batch()
+
+        if not self.api_version:
+            self.fail("api_version is required when batch is not used")
 
         if self.url is None:
             rargs = dict()
@@ -227,8 +306,57 @@ class AzureRMResource(AzureRMModuleBase):
 
             self.url = resource_id(**rargs)
 
+        needs_update, response = self.send_request(self.url, self.method, self.api_version, self.body,
+                                                   self.idempotency, self.state, self.status_code)
+
+        self.results['response'] = response
+        self.results['changed'] = needs_update
+
+        return self.results
+
+    def exec_batch(self):
+        results = parallel_map(self.send_batch_item, self.batch, self.batch_concurrency)
+        self.results.pop('response', None)
+        self.results['results'] = results
+        self.results['changed'] = any(result['changed'] for result in results)
+
+        failed = [result for result in results if result['failed']]
+        if failed:
+            self.fail("{0} of {1} batch requests failed".format(len(failed), len(results)), **self.results)
+        return self.results
+
+    def send_batch_item(self, item):
+        result = dict(url=item.get('url') if isinstance(item, dict) else None, changed=False, failed=False, response=None)
+        try:
+            if not result['url']:
+                raise ValueError("batch item must be a dict with a url")
+            api_version = item.get('api_version') or self.api_version
+            if not api_version:
+                raise ValueError("api_version is required")
+            state = item.get('state') or self.state
+            result['changed'], result['response'] = self.send_request(
+                item['url'],
+                item.get('method') or self.method,
+                api_version,
+                item.get('body'),
+                item.get('idempotency', self.idempotency),
+                state,
+                list(item.get('status_code') or self.status_code))
+        except CloudError as exc:
+            result['failed'] = True
+            result['msg'] = exc.message
+        except Exception as exc:
+            result['failed'] = True
+            result['msg'] = str(exc)
+        return result
+
+    def send_request(self, url, method, api_version, body, idempotency, state, status_code):
+        if state == 'absent':
+            method = 'DELETE'
+            status_code = status_code + [204]
+
         query_parameters = {}
-        query_parameters['api-version'] = self.api_version
+        query_parameters['api-version'] = api_version
 
         header_parameters = {}
         header_parameters['Content-Type'] = 'application/json; charset=utf-8'
@@ -236,22 +364,22 @@ class AzureRMResource(AzureRMModuleBase):
         needs_update = True
         response = None
 
-        if self.idempotency:
-            original = self.mgmt_client.query(self.url, "GET", query_parameters, None, None, [200, 404])
+        if idempotency:
+            original = self.mgmt_client.query(url, "GET", query_parameters, None, None, [200, 404])
 
             if original.status_code == 404:
-                if self.state == 'absent':
+                if state == 'absent':
                     needs_update = False
             else:
                 try:
                     response = json.loads(original.text)
-                    needs_update = (dict_merge(response, self.body) != response)
+                    needs_update = (dict_merge(response, body) != response)
                 except:
                     pass
 
         if needs_update:
-            response = self.mgmt_client.query(self.url, self.method, query_parameters, header_parameters, self.body, self.status_code)
-            if self.state == 'present':
+            response = self.mgmt_client.query(url, method, query_parameters, header_parameters, body, status_code)
+            if state == 'present':
                 try:
                     response = json.loads(response.text)
                 except:
@@ -259,10 +387,7 @@ class AzureRMResource(AzureRMModuleBase):
             else:
                 response = None
 
-        self.results['response'] = response
-        self.results['changed'] = needs_update
-
-        return self.results
+        return needs_update, response
 
 
 def dict_merge(a, b):
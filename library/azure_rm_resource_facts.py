@@ -57,9 +57,20 @@ options:
       name:
         description:
           - Subresource name
+  max_items:
+    description:
+      - Maximum number of items to return when I(url) points to a list of resources.
+      - All pages are fetched by following C(nextLink) if not specified.
+    type: int
+  page_size:
+    description:
+      - Number of items to request per page, sent as C($top).
+      - Only a hint, not every resource type supports it.
+    type: int
 
 extends_documentation_fragment:
   - azure
+  - azure_facts
 
 author:
   - "Zim Kalinowski (@zikalino)"
@@ -74,23 +85,30 @@ EXAMPLES = '''
       resource_type: virtualmachinescalesets
       resource_name: "{{ scaleset_name }}"
       api_version: "2017-12-01"
+
+  - name: List the first 500 managed disks in the subscription
+    azure_rm_resource_facts:
+      url: "/subscriptions/{{ subscription_id }}/providers/Microsoft.Compute/disks"
+      api_version: "2017-03-30"
+      max_items: 500
 '''
 
 RETURN = '''
 response:
-    description: Response specific to resource type.
+    description:
+      - Response specific to resource type.
+      - For list URLs the items of all pages, otherwise a list containing the single resource.
     returned: always
-    type: dict
+    type: list
 '''
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 from ansible.module_utils.azure_rm_common_rest import GenericRestClient
 
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrest.service_client import ServiceClient
     from msrestazure.tools import resource_id, is_valid_resource_id
-    import json
 
 except ImportError:
     # This is handled in azure_rm_common
@@ -129,6 +147,12 @@ class AzureRMResourceFacts(AzureRMModuleBase):
             api_version=dict(
                 type='str',
                 required=True
+            ),
+            max_items=dict(
+                type='int'
+            ),
+            page_size=dict(
+                type='int'
             )
         )
         # store the results of the module operation
@@ -143,7 +167,9 @@ class AzureRMResourceFacts(AzureRMModuleBase):
         self.resource_type = None
         self.resource_name = None
         self.subresource = []
-        super(AzureRMResourceFacts, self).__init__(self.module_arg_spec, supports_tags=False)
+        self.max_items = None
+        self.page_size = None
+        super(AzureRMResourceFacts, self).__init__(self.module_arg_spec, supports_tags=False, facts_module=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -177,23 +203,33 @@ class AzureRMResourceFacts(AzureRMModuleBase):
 
         query_parameters = {}
         query_parameters['api-version'] = self.api_version
+        if self.page_size:
+            query_parameters['$top'] = self.page_size
 
         header_parameters = {}
         header_parameters['Content-Type'] = 'application/json; charset=utf-8'
 
-        response = self.mgmt_client.query(self.url, "GET", query_parameters, header_parameters, None, [200, 404])
-
-        try:
-            response = json.loads(response.text)
-            if response is list:
-                self.results['response'] = response
-            else:
-                self.results['response'] = [response]
-        except:
-            self.results['response'] = []
+        self.results['response'] = project_fields(self.get_items(query_parameters, header_parameters), self.fields)
 
         return self.results
 
+    def get_items(self, query_parameters, header_parameters):
+        items = []
+        try:
+            pages = self.mgmt_client.query_pages(self.url, query_parameters, header_parameters, [200, 404], prefetch=2)
+            for page in pages:
+                if isinstance(page, dict) and isinstance(page.get('value'), list) and 'id' not in page:
+                    items.extend(page['value'])
+                else:
+                    items.append(page)
+                if self.max_items and len(items) >= self.max_items:
+                    pages.close()
+                    return items[:self.max_items]
+        except ValueError:
+            # response body is not JSON, return what has been collected so far
+            pass
+        return items
+
 
 def main():
     AzureRMResourceFacts()
@@ -32,9 +32,11 @@ options:
     tags:
         description:
             - Limit results by providing a list of tags. Format tags as 'key' or 'key:value'.
+            - A single tag is filtered by Azure.
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Chris Houseknecht (@chouseknecht)"
@@ -138,7 +140,7 @@ class AzureRMResourceGroupFacts(AzureRMModuleBase):
     def list_items(self):
         self.log('List all items')
         try:
-            response = self.rm_client.resource_groups.list()
+            response = self.rm_client.resource_groups.list(filter=self.get_tag_filter(self.tags))
         except CloudError as exc:
             self.fail("Failed to list all items - {0}".format(str(exc)))
 
@@ -186,6 +186,24 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+rules_diff:
+    description: Names of the rules added, modified and removed when updating an existing security group.
+    returned: when the security group exists and I(state=present)
+    type: dict
+    sample: {
+        "added": ["AllowHTTPS"],
+        "modified": ["AllowSSH"],
+        "removed": []
+    }
+default_rules_diff:
+    description: Names of the default rules added, modified and removed when updating an existing security group.
+    returned: when the security group exists and I(state=present)
+    type: dict
+    sample: {
+        "added": [],
+        "modified": [],
+        "removed": []
+    }
 state:
     description: Current state of the security group.
     returned: always
@@ -363,53 +381,73 @@ def validate_rule(self, rule, rule_type=None):
     check_plural('destination_port_range', 'destination_port_ranges')
 
 
-def compare_rules_change(old_list, new_list, purge_list):
+def normalize_values(value, values):
+    '''
+    Merge the singular and plural form of a port range or address prefix into a sorted tuple.
+    Ranges like 80-80 equal 80, host prefixes like 10.0.0.1/32 equal 10.0.0.1, and tags are compared without case.
+    '''
+    normalized = set()
+    for item in ([value] if value is not None else []) + list(values or []):
+        item = str(item).strip().lower()
+        low, sep, high = item.partition('-')
+        if sep and low == high:
+            item = low
+        if item.endswith('/32'):
+            item = item[:-3]
+        normalized.add(item)
+    return tuple(sorted(normalized))
+
+
+def rule_key(rule):
+    '''
+    Canonical tuple of the settings of a rule dict, equal for rules that Azure treats as the same.
+    '''
+    return (
+        rule.get('description') or '',
+        (rule.get('protocol') or '').lower(),
+        normalize_values(rule.get('source_port_range'), rule.get('source_port_ranges')),
+        normalize_values(rule.get('destination_port_range'), rule.get('destination_port_ranges')),
+        normalize_values(rule.get('source_address_prefix'), rule.get('source_address_prefixes')),
+        normalize_values(rule.get('destination_address_prefix'), rule.get('destination_address_prefixes')),
+        (rule.get('access') or '').lower(),
+        rule.get('priority'),
+        (rule.get('direction') or '').lower()
+    )
+
+
+def diff_rules(old_list, new_list, purge_list):
+    '''
+    Compare the current rules with the requested ones by name.
+
+    :param old_list: current rule dicts
+    :param new_list: requested rule dicts
+    :param purge_list: remove current rules that are not requested
+    :return: tuple of changed, list of rules to apply, dict with the names of added, modified and removed rules
+    '''
     old_list = old_list or []
     new_list = new_list or []
-    changed = False
-
+    old_index = dict((rule['name'], rule) for rule in old_list)
+    new_names = set(rule['name'] for rule in new_list)
+
+    diff = dict(added=[], modified=[], removed=[])
+    for rule in new_list:
+        old_rule = old_index.get(rule['name'])
+        if old_rule is None:
+            diff['added'].append(rule['name'])
+        elif rule_key(old_rule) != rule_key(rule):
+            diff['modified'].append(rule['name'])
+
+    rules = list(new_list)
     for old_rule in old_list:
-        matched = next((x for x in new_list if x['name'] == old_rule['name']), [])
-        if matched:  # if the new one is in the old list, check whether it is updated
-            changed = changed or compare_rules(old_rule, matched)
-        elif not purge_list:  # keep this rule
-            new_list.append(old_rule)
-        else:  # one rule is removed
-            changed = True
-    return changed, new_list
-
-
-def compare_rules(old_rule, rule):
-    changed = False
-    if old_rule['name'] != rule['name']:
-        changed = True
-    if rule.get('description', None) != old_rule['description']:
-        changed = True
-    if rule['protocol'] != old_rule['protocol']:
-        changed = True
-    if str(rule['source_port_range']) != str(old_rule['source_port_range']):
-        changed = True
-    if str(rule['destination_port_range']) != str(old_rule['destination_port_range']):
-        changed = True
-    if rule['access'] != old_rule['access']:
-        changed = True
-    if rule['priority'] != old_rule['priority']:
-        changed = True
-    if rule['direction'] != old_rule['direction']:
-        changed = True
-    if str(rule['source_address_prefix']) != str(old_rule['source_address_prefix']):
-        changed = True
-    if str(rule['destination_address_prefix']) != str(old_rule['destination_address_prefix']):
-        changed = True
-    if set(rule.get('source_address_prefixes') or []) != set(old_rule.get('source_address_prefixes') or []):
-        changed = True
-    if set(rule.get('destination_address_prefixes') or []) != set(old_rule.get('destination_address_prefixes') or []):
-        changed = True
-    if set(rule.get('source_port_ranges') or []) != set(old_rule.get('source_port_ranges') or []):
-        changed = True
-    if set(rule.get('destination_port_ranges') or []) != set(old_rule.get('destination_port_ranges') or []):
-        changed = True
-    return changed
+        if old_rule['name'] in new_names:
+            continue
+        if purge_list:
+            diff['removed'].append(old_rule['name'])
+        else:  # keep this rule
+            rules.append(old_rule)
+
+    changed = bool(diff['added'] or diff['modified'] or diff['removed'])
+    return changed, rules, diff
 
 
 def create_rule_instance(self, rule):
@@ -547,9 +585,6 @@ class AzureRMSecurityGroup(AzureRMModuleBase):
                                                    supports_check_mode=True)
 
     def exec_module(self, **kwargs):
-        # tighten up poll interval for security groups; default 30s is an eternity
-        # this value is still overridden by the response Retry-After header (which is set on the initial operation response to 10s)
-        self.network_client.config.long_running_operation_timeout = 3
         self.nsg_models = self.network_client.network_security_groups.models
 
         for key in list(self.module_arg_spec.keys()) + ['tags']:
@@ -601,11 +636,13 @@ class AzureRMSecurityGroup(AzureRMModuleBase):
             if update_tags:
                 changed = True
 
-            rule_changed, new_rule = compare_rules_change(results['rules'], self.rules, self.purge_rules)
+            rule_changed, new_rule, self.results['rules_diff'] = diff_rules(results['rules'], self.rules, self.purge_rules)
             if rule_changed:
                 changed = True
                 results['rules'] = new_rule
-            rule_changed, new_rule = compare_rules_change(results['default_rules'], self.default_rules, self.purge_default_rules)
+            rule_changed, new_rule, self.results['default_rules_diff'] = diff_rules(results['default_rules'],
+                                                                                    self.default_rules,
+                                                                                    self.purge_default_rules)
             if rule_changed:
                 changed = True
                 results['default_rules'] = new_rule
@@ -39,6 +39,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Chris Houseknecht (@chouseknecht)"
@@ -194,7 +195,7 @@ except:
     # This is handled in azure_rm_common
     pass
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 
 AZURE_OBJECT_CLASS = 'NetworkSecurityGroup'
@@ -245,8 +246,9 @@ class AzureRMSecurityGroupFacts(AzureRMModuleBase):
             pass
 
         if item and self.has_tags(item.tags, self.tags):
-            grp = self.serialize_obj(item, AZURE_OBJECT_CLASS)
+            grp = self.serialize_obj(item, AZURE_OBJECT_CLASS, apply_fields=False)
             grp['name'] = item.name
+            grp = project_fields(grp, self.fields)
             result = [grp]
 
         return result
@@ -261,8 +263,9 @@ class AzureRMSecurityGroupFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                grp = self.serialize_obj(item, AZURE_OBJECT_CLASS)
+                grp = self.serialize_obj(item, AZURE_OBJECT_CLASS, apply_fields=False)
                 grp['name'] = item.name
+                grp = project_fields(grp, self.fields)
                 results.append(grp)
         return results
 
@@ -132,6 +132,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running operation to complete.
+        - With C(no) the module returns right away with I(operation), use M(azure_rm_operation_facts) to poll it.
+      type: bool
+      default: yes
+      version_added: "2.8"
 
 extends_documentation_fragment:
     - azure
@@ -191,9 +198,19 @@ status:
     returned: always
     type: str
     sample: Online
+operation:
+    description:
+        - Handle of the running operation, poll it with M(azure_rm_operation_facts).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample:
+        id: "/subscriptions/XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX/resourceGroups/Testing/providers/Microsoft.Sql/servers/sqlcrudtest-5961/databases/testdb"
+        method: PUT
+        api_version: "2015-05-01-preview"
+        status_url: "https://management.azure.com/subscriptions/XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX/resourceGroups/Testing/providers/\\
+                     Microsoft.Sql/servers/sqlcrudtest-5961/databases/testdb/azureAsyncOperation/..."
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -294,12 +311,17 @@ class AzureRMDatabases(AzureRMModuleBase):
                 type='str',
                 default='present',
                 choices=['present', 'absent']
+            ),
+            wait=dict(
+                type='bool',
+                default=True
             )
         )
 
         self.resource_group = None
         self.server_name = None
         self.name = None
+        self.wait = None
         self.parameters = dict()
 
         self.results = dict(changed=False)
@@ -409,8 +431,8 @@ class AzureRMDatabases(AzureRMModuleBase):
             self.delete_sqldatabase()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_sqldatabase():
-                time.sleep(20)
+            if self.wait:
+                self.wait_until_gone(self.get_sqldatabase, self.name)
         else:
             self.log("SQL Database instance unchanged")
             self.results['changed'] = False
@@ -437,6 +459,8 @@ class AzureRMDatabases(AzureRMModuleBase):
                                                                    database_name=self.name,
                                                                    parameters=self.parameters)
             if isinstance(response, AzureOperationPoller):
+                if not self.wait:
+                    self.exit_with_operation(response)
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
@@ -455,6 +479,8 @@ class AzureRMDatabases(AzureRMModuleBase):
             response = self.mgmt_client.databases.delete(resource_group_name=self.resource_group,
                                                          server_name=self.server_name,
                                                          database_name=self.name)
+            if not self.wait and isinstance(response, AzureOperationPoller):
+                self.exit_with_operation(response)
         except CloudError as e:
             self.log('Error attempting to delete the SQL Database instance.')
             self.fail("Error deleting the SQL Database instance: {0}".format(str(e)))
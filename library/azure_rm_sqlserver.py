@@ -94,7 +94,6 @@ fully_qualified_domain_name:
     sample: sqlcrudtest-4645.database.windows.net
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -231,8 +230,7 @@ class AzureRMServers(AzureRMModuleBase):
             self.delete_sqlserver()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_sqlserver():
-                time.sleep(20)
+            self.wait_until_gone(self.get_sqlserver, self.name)
         else:
             self.log("SQL Server instance unchanged")
             self.results['changed'] = False
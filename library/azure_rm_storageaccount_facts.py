@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Chris Houseknecht (@chouseknecht)"
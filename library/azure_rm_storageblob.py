@@ -22,6 +22,7 @@ version_added: "2.1"
 description:
     - Create, update and delete blob containers and blob objects. Use to upload a file and store it as a blob object,
       or download a blob object to a file.
+    - Synchronize a local directory with the blobs of a container in one task.
 options:
     storage_account_name:
         description:
@@ -33,6 +34,8 @@ options:
     blob:
         description:
             - Name of a blob object within the container.
+            - With I(src_dir) or I(dest_dir), name of the virtual directory in the container that is synchronized.
+              The whole container is synchronized if not specified.
         aliases:
             - blob_name
     blob_type:
@@ -111,6 +114,69 @@ options:
         choices:
             - container
             - blob
+    sync:
+        description:
+            - With C(checksum), upload I(src) only if its MD5 hash differs from the C(content_md5) of the blob, or the
+              blob has no stored hash. An existing blob is then updated without I(force) and an identical one is never
+              uploaded again.
+            - The hash of the uploaded file is stored as C(content_md5) of the blob, unless I(content_md5) is set.
+        choices:
+            - checksum
+        version_added: "2.8"
+    src_dir:
+        description:
+            - Source directory. Use with state 'present' to upload all files of the directory and its subdirectories
+              that are missing in the container or differ from their blob.
+        type: path
+        version_added: "2.8"
+    dest_dir:
+        description:
+            - Destination directory. Use with state 'present' to download all blobs that are missing in the directory
+              or differ from their file. The directory is created if it does not exist. Fails without downloading
+              anything if a blob name would resolve to a path outside of the directory.
+        type: path
+        version_added: "2.8"
+    compare:
+        description:
+            - How I(src_dir) and I(dest_dir) detect changed files.
+            - C(md5) compares size and MD5 hash of the file with size and C(content_md5) of the blob, and falls back to
+              C(last_modified) for blobs without a stored hash.
+            - C(last_modified) compares size and considers the newer side changed.
+        choices:
+            - md5
+            - last_modified
+        default: md5
+        version_added: "2.8"
+    delete_extra:
+        description:
+            - With I(src_dir), delete blobs without a file in the directory. With I(dest_dir), delete files without a blob.
+        type: bool
+        default: no
+        version_added: "2.8"
+    max_connections:
+        description:
+            - Maximum number of parallel connections used to upload or download a blob.
+            - With I(src_dir) or I(dest_dir), maximum number of files transferred at the same time.
+        type: int
+        default: 2
+        version_added: "2.8"
+    block_size:
+        description:
+            - Size in MB of the blocks uploaded or the ranges downloaded per request. At most I(max_connections) blocks
+              are held in memory at a time.
+            - Every block is sent and, up to 4 MB, received with its MD5 hash, which Azure and the module verify.
+        type: int
+        default: 4
+        version_added: "2.8"
+    resume:
+        description:
+            - Resume an interrupted transfer instead of starting over.
+            - Uploads of block blobs skip the blocks that were uploaded but not committed yet. Downloads continue
+              the partial file C(dest).partial if the blob did not change in the meantime.
+            - Not used with I(src_dir) or I(dest_dir).
+        type: bool
+        default: no
+        version_added: "2.8"
 
 extends_documentation_fragment:
     - azure
@@ -140,6 +206,36 @@ EXAMPLES = '''
     public_access: container
     content_type: 'application/image'
 
+- name: Upload a large image, resuming an interrupted upload
+  azure_rm_storageblob:
+    resource_group: Testing
+    storage_account_name: clh0002
+    container: vhds
+    blob: image.vhd
+    src: ./image.vhd
+    max_connections: 8
+    block_size: 16
+    resume: yes
+
+- name: Upload an artifact only if its content changed
+  azure_rm_storageblob:
+    resource_group: Testing
+    storage_account_name: clh0002
+    container: artifacts
+    blob: app.tar.gz
+    src: ./build/app.tar.gz
+    sync: checksum
+
+- name: Publish a build output, removing blobs of deleted files
+  azure_rm_storageblob:
+    resource_group: Testing
+    storage_account_name: clh0002
+    container: site
+    blob: v2
+    src_dir: ./dist
+    delete_extra: yes
+    max_connections: 16
+
 - name: Download the file
   azure_rm_storageblob:
     resource_group: Testing
@@ -178,18 +274,102 @@ container:
         "name": "foo",
         "tags": {}
     }
+files:
+    description: Files uploaded, downloaded or deleted by I(src_dir) or I(dest_dir), in the order of their names.
+    returned: when a directory is synchronized
+    type: complex
+    contains:
+        name:
+            description: Path of the file relative to the directory, which is also the blob name below I(blob).
+            type: str
+            sample: css/site.css
+        action:
+            description: C(uploaded), C(downloaded) or C(deleted).
+            type: str
+            sample: uploaded
+unchanged:
+    description: Number of files that were already synchronized.
+    returned: when a directory is synchronized
+    type: int
+    sample: 3998
+resumed_bytes:
+    description: Number of bytes of an interrupted transfer that were not transferred again.
+    returned: when a blob is transferred with I(resume)
+    type: int
+    sample: 8388608
 '''
 
 import os
+import json
+import threading
+import errno
+import base64
+import hashlib
+import calendar
+import mimetypes
 
 try:
-    from azure.storage.blob.models import ContentSettings
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+try:
+    from azure.storage.blob.models import ContentSettings, BlobBlock, BlockListType
     from azure.common import AzureMissingResourceHttpError, AzureHttpError
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, parallel_map
+
+MB = 1024 * 1024
+# Azure returns the MD5 hash of a range only for ranges up to 4 MB
+MAX_MD5_RANGE_SIZE = 4 * MB
+# files from this size on are read on a separate thread while hashing
+READ_AHEAD_SIZE = 64 * MB
+
+
+def read_chunks(path, read_ahead=0):
+    '''
+    Yield the content of a file in chunks of 1 MB. With read_ahead, up to read_ahead chunks are read by a
+    separate thread while the caller consumes the previous ones, so that disk reads overlap with processing.
+    '''
+    with open(path, 'rb') as src:
+        if not read_ahead:
+            for chunk in iter(lambda: src.read(MB), b''):
+                yield chunk
+            return
+
+        chunks = Queue(maxsize=read_ahead)
+        failed = []
+
+        def reader():
+            try:
+                for chunk in iter(lambda: src.read(MB), b''):
+                    chunks.put(chunk)
+            except Exception as exc:
+                failed.append(exc)
+            chunks.put(None)
+
+        thread = threading.Thread(target=reader)
+        thread.daemon = True
+        thread.start()
+        for chunk in iter(chunks.get, None):
+            yield chunk
+        thread.join()
+        if failed:
+            raise failed[0]
+
+
+def file_md5(path, read_ahead=0):
+    '''
+    Return the base64 encoded MD5 hash of a file, as stored in the content_md5 of a blob.
+    The file is streamed, so memory use does not grow with its size.
+    '''
+    md5 = hashlib.md5()
+    for chunk in read_chunks(path, read_ahead):
+        md5.update(chunk)
+    return base64.b64encode(md5.digest()).decode('utf-8')
 
 
 class AzureRMStorageBlob(AzureRMModuleBase):
@@ -213,9 +393,17 @@ class AzureRMStorageBlob(AzureRMModuleBase):
             content_disposition=dict(type='str'),
             cache_control=dict(type='str'),
             content_md5=dict(type='str'),
+            max_connections=dict(type='int', default=2),
+            block_size=dict(type='int', default=4),
+            resume=dict(type='bool', default=False),
+            sync=dict(type='str', choices=['checksum']),
+            src_dir=dict(type='path'),
+            dest_dir=dict(type='path'),
+            compare=dict(type='str', choices=['md5', 'last_modified'], default='md5'),
+            delete_extra=dict(type='bool', default=False),
         )
 
-        mutually_exclusive = [('src', 'dest')]
+        mutually_exclusive = [('src', 'dest', 'src_dir', 'dest_dir')]
 
         self.blob_client = None
         self.blob_details = None
@@ -232,6 +420,15 @@ class AzureRMStorageBlob(AzureRMModuleBase):
         self.state = None
         self.tags = None
         self.public_access = None
+        self.max_connections = None
+        self.block_size = None
+        self.resume = None
+        self.sync = None
+        self.src_md5 = None
+        self.src_dir = None
+        self.dest_dir = None
+        self.compare = None
+        self.delete_extra = None
         self.results = dict(
             changed=False,
             actions=[],
@@ -253,10 +450,18 @@ class AzureRMStorageBlob(AzureRMModuleBase):
 
         # add file path validation
 
+        if self.max_connections < 1:
+            self.fail("Parameter error: max_connections must be at least 1.")
+        if self.block_size < 1 or self.block_size > 100:
+            self.fail("Parameter error: block_size must be between 1 and 100 MB.")
+
         self.blob_client = self.get_blob_client(self.resource_group, self.storage_account_name, self.blob_type)
+        # transfer size of the SDK's own chunked uploads and downloads
+        self.blob_client.MAX_BLOCK_SIZE = self.block_size * MB
+        self.blob_client.MAX_CHUNK_GET_SIZE = self.block_size * MB
         self.container_obj = self.get_container()
 
-        if self.blob is not None:
+        if self.blob is not None and not (self.src_dir or self.dest_dir):
             self.blob_obj = self.get_blob()
 
         if self.state == 'present':
@@ -269,10 +474,15 @@ class AzureRMStorageBlob(AzureRMModuleBase):
                 if update_tags:
                     self.update_container_tags(self.container_obj['tags'])
 
-            if self.blob:
+            if self.src_dir or self.dest_dir:
+                self.sync_directory()
+            elif self.blob:
                 # create, update or download blob
                 if self.src and self.src_is_valid():
-                    if self.blob_obj and not self.force:
+                    if self.sync == 'checksum':
+                        if self.src_differs():
+                            self.upload_blob()
+                    elif self.blob_obj and not self.force:
                         self.log("Cannot upload to {0}. Blob with that name already exists. "
                                  "Use the force option".format(self.blob))
                     else:
@@ -366,22 +576,48 @@ class AzureRMStorageBlob(AzureRMModuleBase):
         self.results['actions'].append('created container {0}'.format(self.container))
         self.results['container'] = self.container_obj
 
+    def src_differs(self):
+        '''
+        Compare src with the blob by size and MD5 hash. Hashes only if the sizes match, large files are read
+        ahead on a separate thread while hashing.
+        '''
+        if not self.blob_obj or not self.blob_obj['content_settings'].get('content_md5'):
+            return True
+        size = os.path.getsize(self.src)
+        if size != self.blob_obj['content_length']:
+            return True
+        self.src_md5 = file_md5(self.src, read_ahead=4 if size >= READ_AHEAD_SIZE else 0)
+        return self.src_md5 != self.blob_obj['content_settings']['content_md5']
+
+    def desired_content_md5(self):
+        if self.content_md5 or self.sync != 'checksum':
+            return self.content_md5
+        # keep the hash of the uploaded file, which later runs compare with
+        if self.src_md5 is None:
+            self.src_md5 = file_md5(self.src, read_ahead=4 if os.path.getsize(self.src) >= READ_AHEAD_SIZE else 0)
+        return self.src_md5
+
     def upload_blob(self):
         content_settings = None
         if self.content_type or self.content_encoding or self.content_language or self.content_disposition or \
-                self.cache_control or self.content_md5:
+                self.cache_control or self.content_md5 or self.sync == 'checksum':
             content_settings = ContentSettings(
                 content_type=self.content_type,
                 content_encoding=self.content_encoding,
                 content_language=self.content_language,
                 content_disposition=self.content_disposition,
                 cache_control=self.cache_control,
-                content_md5=self.content_md5
+                content_md5=self.desired_content_md5()
             )
         if not self.check_mode:
             try:
-                self.blob_client.create_blob_from_path(self.container, self.blob, self.src,
-                                                       metadata=self.tags, content_settings=content_settings)
+                # an empty file has no blocks to resume
+                if self.resume and self.blob_type == 'block' and os.path.getsize(self.src) > 0:
+                    self.upload_blob_blocks(content_settings)
+                else:
+                    self.blob_client.create_blob_from_path(self.container, self.blob, self.src,
+                                                           metadata=self.tags, content_settings=content_settings,
+                                                           validate_content=True, max_connections=self.max_connections)
             except AzureHttpError as exc:
                 self.fail("Error creating blob {0} - {1}".format(self.blob, str(exc)))
 
@@ -391,10 +627,103 @@ class AzureRMStorageBlob(AzureRMModuleBase):
         self.results['container'] = self.container_obj
         self.results['blob'] = self.blob_obj
 
+    def upload_blob_blocks(self, content_settings):
+        '''
+        Upload src in blocks of block_size, skipping blocks already uploaded to the blob but not committed.
+        Block ids are derived from size, modification time and block size of the file, so that blocks of
+        a previous version of the file are never reused.
+        '''
+        size = os.path.getsize(self.src)
+        block_size = self.block_size * MB
+        fingerprint = hashlib.md5('{0}:{1}:{2}'.format(size, os.path.getmtime(self.src), block_size).encode('utf-8')).hexdigest()[:16]
+        blocks = [('{0}-{1:06d}'.format(fingerprint, index), index * block_size, min(block_size, size - index * block_size))
+                  for index in range(max((size + block_size - 1) // block_size, 1))]
+
+        uploaded = dict()
+        try:
+            block_list = self.blob_client.get_block_list(self.container, self.blob, block_list_type=BlockListType.Uncommitted)
+            uploaded = dict((block.id, block.size) for block in block_list.uncommitted_blocks)
+        except AzureMissingResourceHttpError:
+            pass
+        missing = [block for block in blocks if uploaded.get(block[0]) != block[2]]
+        self.results['resumed_bytes'] = sum(block[2] for block in blocks if block not in missing)
+
+        errors = [error for error in parallel_map(self.upload_block, missing, self.max_connections) if error]
+        if errors:
+            self.fail("Error uploading blob {0}, run again with resume to continue - {1}".format(self.blob, errors[0]))
+
+        self.blob_client.put_block_list(self.container, self.blob, [BlobBlock(id=block[0]) for block in blocks],
+                                        content_settings=content_settings, metadata=self.tags, validate_content=True)
+
+    def upload_block(self, block):
+        # runs on a worker thread, only one block per thread is held in memory
+        block_id, offset, length = block
+        try:
+            with open(self.src, 'rb') as src:
+                src.seek(offset)
+                data = src.read(length)
+            self.blob_client.put_block(self.container, self.blob, data, block_id, validate_content=True)
+        except Exception as exc:
+            return "block {0} - {1}".format(offset // (self.block_size * MB), str(exc))
+        return None
+
+    def download_blob_ranges(self):
+        '''
+        Download the blob in ranges of block_size into dest.partial, writing the ranges in order so that the
+        partial file always holds a complete prefix of the blob. dest.partial.json records the ETag of the blob,
+        a download is only continued if the blob did not change.
+        '''
+        partial_path = self.dest + '.partial'
+        state_path = partial_path + '.json'
+        block_size = self.block_size * MB
+
+        properties = self.blob_client.get_blob_properties(self.container, self.blob).properties
+        size = properties.content_length
+        etag = properties.etag
+
+        offset = 0
+        try:
+            with open(state_path, 'r') as state_file:
+                if json.load(state_file).get('etag') == etag and os.path.isfile(partial_path):
+                    offset = os.path.getsize(partial_path) // block_size * block_size
+        except (IOError, OSError, ValueError):
+            pass
+        with open(state_path, 'w') as state_file:
+            json.dump(dict(etag=etag), state_file)
+        self.results['resumed_bytes'] = offset
+
+        with open(partial_path, 'ab' if offset else 'wb') as partial:
+            partial.truncate(offset)
+            ranges = [(start, min(start + block_size, size) - 1, etag) for start in range(offset, size, block_size)]
+            window = self.max_connections
+            for index in range(0, len(ranges), window):
+                # at most max_connections ranges are held in memory
+                for data, error in parallel_map(self.download_range, ranges[index:index + window], self.max_connections):
+                    if error:
+                        self.fail("Failed to download blob {0}:{1}, run again with resume to continue - {2}".format(
+                            self.container, self.blob, error))
+                    partial.write(data)
+        os.rename(partial_path, self.dest)
+        os.remove(state_path)
+
+    def download_range(self, blob_range):
+        # runs on a worker thread, errors are returned
+        start, end, etag = blob_range
+        try:
+            blob = self.blob_client.get_blob_to_bytes(self.container, self.blob, start_range=start, end_range=end, if_match=etag,
+                                                      validate_content=end - start + 1 <= MAX_MD5_RANGE_SIZE)
+            return blob.content, None
+        except Exception as exc:
+            return None, "range {0}-{1} - {2}".format(start, end, str(exc))
+
     def download_blob(self):
         if not self.check_mode:
             try:
-                self.blob_client.get_blob_to_path(self.container, self.blob, self.dest)
+                if self.resume:
+                    self.download_blob_ranges()
+                else:
+                    self.blob_client.get_blob_to_path(self.container, self.blob, self.dest, max_connections=self.max_connections,
+                                                      validate_content=self.block_size * MB <= MAX_MD5_RANGE_SIZE)
             except Exception as exc:
                 self.fail("Failed to download blob {0}:{1} to {2} - {3}".format(self.container,
                                                                                 self.blob,
@@ -408,6 +737,135 @@ class AzureRMStorageBlob(AzureRMModuleBase):
         self.results['container'] = self.container_obj
         self.results['blob'] = self.blob_obj
 
+    def sync_directory(self):
+        '''
+        Upload src_dir to, or download dest_dir from, the blobs below the virtual directory blob. The container is
+        listed once, and only missing or changed files are transferred, at most max_connections at the same time.
+        '''
+        upload = bool(self.src_dir)
+        root = self.src_dir or self.dest_dir
+        prefix = self.blob.strip('/') + '/' if self.blob and self.blob.strip('/') else ''
+        if upload and not os.path.isdir(root):
+            self.fail("Source directory {0} does not exist or is not a directory.".format(root))
+        if not upload and os.path.exists(root) and not os.path.isdir(root):
+            self.fail("Destination {0} is not a directory.".format(root))
+
+        blobs = dict()
+        if self.container_obj:
+            try:
+                for blob in self.blob_client.list_blobs(self.container, prefix=prefix or None):
+                    if not blob.name.endswith('/'):
+                        blobs[blob.name[len(prefix):]] = blob.properties
+            except AzureHttpError as exc:
+                self.fail("Error listing blobs of container {0} - {1}".format(self.container, str(exc)))
+
+        files = dict()
+        for dirpath, dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                files[os.path.relpath(path, root).replace(os.sep, '/')] = path
+
+        if upload:
+            candidates = [(name, files[name], blobs.get(name)) for name in sorted(files)]
+            extras = [name for name in sorted(blobs) if name not in files]
+        else:
+            candidates = [(name, os.path.realpath(os.path.join(root, *name.split('/'))), blobs[name]) for name in sorted(blobs)]
+            extras = [name for name in sorted(files) if name not in blobs]
+            # blob names may contain '..', never write outside of dest_dir
+            real_root = os.path.join(os.path.realpath(root), '')
+            outside = [name for name, path, properties in candidates if not path.startswith(real_root)]
+            if outside:
+                self.fail("Blobs {0} of container {1} would be downloaded outside of {2}.".format(
+                    ', '.join(prefix + name for name in outside), self.container, root))
+        changed = parallel_map(lambda candidate: self.file_changed(candidate[1], candidate[2], upload),
+                               candidates, self.max_connections)
+        # a transfer is the blob name, the file path, the blob properties and the hash of the file, if computed
+        transfers = [(prefix + name, path, properties, md5)
+                     for (name, path, properties), (file_changed, md5) in zip(candidates, changed) if file_changed]
+
+        action = 'uploaded' if upload else 'downloaded'
+        synced = [dict(name=blob_name[len(prefix):], action=action) for blob_name, path, properties, md5 in transfers]
+        synced.extend(dict(name=name, action='deleted') for name in extras if self.delete_extra)
+        self.results['files'] = sorted(synced, key=lambda item: item['name'])
+        self.results['unchanged'] = len(candidates) - len(transfers)
+        self.results['changed'] = self.results['changed'] or bool(synced)
+        self.results['container'] = self.container_obj
+        for item in self.results['files']:
+            self.results['actions'].append('{0} {1}'.format(item['action'], prefix + item['name']))
+        if self.check_mode or not synced:
+            return
+
+        errors = [error for error in parallel_map(self.sync_file, transfers, self.max_connections) if error]
+        if self.delete_extra:
+            if upload:
+                errors.extend(error for error in parallel_map(lambda name: self.delete_synced_blob(prefix + name),
+                                                              extras, self.max_connections) if error)
+            else:
+                for name in extras:
+                    try:
+                        os.remove(files[name])
+                    except OSError as exc:
+                        errors.append("{0} - {1}".format(files[name], str(exc)))
+        if errors:
+            self.fail("Error synchronizing {0} with container {1} - {2}".format(root, self.container, ', '.join(errors)),
+                      **self.results)
+
+    def file_changed(self, path, properties, upload):
+        # runs on a worker thread, returns whether the file changed and its hash, if it had to be computed.
+        # A file that cannot be read counts as changed and fails on transfer.
+        try:
+            if properties is None or not os.path.isfile(path) or os.path.getsize(path) != properties.content_length:
+                return True, None
+            if self.compare == 'md5' and properties.content_settings.content_md5:
+                md5 = file_md5(path)
+                return md5 != properties.content_settings.content_md5, md5
+            blob_mtime = calendar.timegm(properties.last_modified.utctimetuple())
+            file_mtime = int(os.path.getmtime(path))
+            return (file_mtime > blob_mtime if upload else blob_mtime > file_mtime), None
+        except (IOError, OSError):
+            return True, None
+
+    def sync_file(self, transfer):
+        # runs on a worker thread, errors are returned
+        blob_name, path, properties, md5 = transfer
+        try:
+            if self.src_dir:
+                # store the hash, so that the next run can compare by content
+                content_settings = ContentSettings(
+                    content_type=self.content_type or mimetypes.guess_type(path)[0],
+                    content_encoding=self.content_encoding,
+                    content_language=self.content_language,
+                    content_disposition=self.content_disposition,
+                    cache_control=self.cache_control,
+                    content_md5=md5 or file_md5(path)
+                )
+                self.blob_client.create_blob_from_path(self.container, blob_name, path, metadata=self.tags,
+                                                       content_settings=content_settings, validate_content=True)
+            else:
+                try:
+                    os.makedirs(os.path.dirname(path))
+                except OSError as exc:
+                    if exc.errno != errno.EEXIST:
+                        raise
+                self.blob_client.get_blob_to_path(self.container, blob_name, path,
+                                                  validate_content=self.block_size * MB <= MAX_MD5_RANGE_SIZE)
+                # keep the time of the blob, so that last_modified compares equal on the next run
+                blob_mtime = calendar.timegm(properties.last_modified.utctimetuple())
+                os.utime(path, (blob_mtime, blob_mtime))
+        except Exception as exc:
+            return "{0} - {1}".format(blob_name, str(exc))
+        return None
+
+    def delete_synced_blob(self, blob_name):
+        # runs on a worker thread, errors are returned
+        try:
+            self.blob_client.delete_blob(self.container, blob_name)
+        except AzureMissingResourceHttpError:
+            pass
+        except Exception as exc:
+            return "{0} - {1}".format(blob_name, str(exc))
+        return None
+
     def src_is_valid(self):
         if not os.path.isfile(self.src):
             self.fail("The source path must be a file.")
@@ -507,13 +965,16 @@ class AzureRMStorageBlob(AzureRMModuleBase):
     def blob_content_settings_differ(self):
         if self.content_type or self.content_encoding or self.content_language or self.content_disposition or \
                 self.cache_control or self.content_md5:
+            content_md5 = self.content_md5
+            if not content_md5 and self.sync == 'checksum':
+                content_md5 = self.blob_obj['content_settings'].get('content_md5')
             settings = dict(
                 content_type=self.content_type,
                 content_encoding=self.content_encoding,
                 content_language=self.content_language,
                 content_disposition=self.content_disposition,
                 cache_control=self.cache_control,
-                content_md5=self.content_md5
+                content_md5=content_md5
             )
             if self.blob_obj['content_settings'] != settings:
                 return True
@@ -521,13 +982,16 @@ class AzureRMStorageBlob(AzureRMModuleBase):
         return False
 
     def update_blob_content_settings(self):
+        content_md5 = self.content_md5
+        if not content_md5 and self.sync == 'checksum':
+            content_md5 = self.blob_obj['content_settings'].get('content_md5')
         content_settings = ContentSettings(
             content_type=self.content_type,
             content_encoding=self.content_encoding,
             content_language=self.content_language,
             content_disposition=self.content_disposition,
             cache_control=self.cache_control,
-            content_md5=self.content_md5
+            content_md5=content_md5
         )
         if not self.check_mode:
             try:
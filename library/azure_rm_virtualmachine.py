@@ -438,6 +438,11 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+image_version:
+    description: Marketplace image version the virtual machine is created from, with C(latest) resolved.
+    returned: when I(image) is a marketplace image and I(state=present)
+    type: string
+    example: 16.04.201808140
 powerstate:
     description: Indicates if the state is running, stopped, deallocated
     returned: always
@@ -458,6 +463,13 @@ deleted_public_ips:
     returned: 'on delete'
     type: list
     example: ["testvm1001"]
+deleted_resources:
+    description:
+        - Outcome of deleting every resource attached to the virtual machine.
+        - Network interfaces, disks and VHDs are deleted concurrently, public IPs once the network interfaces are gone.
+    returned: 'on delete'
+    type: list
+    example: [{"type": "network_interface", "name": "testvm1001", "deleted": true}]
 azure_vm:
     description: Facts about the current state of the object. Note that facts are not part of the registered output but available directly.
     returned: always
@@ -614,7 +626,7 @@ except ImportError:
     pass
 
 from ansible.module_utils.basic import to_native, to_bytes
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase, azure_id_to_dict, normalize_location_name
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, azure_id_to_dict, normalize_location_name, parallel_map
 
 
 AZURE_OBJECT_CLASS = 'VirtualMachine'
@@ -752,6 +764,9 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
                     self.vm_size
                 ))
 
+            if self.vm_size and self.data_disks:
+                self.check_data_disk_count(self.location, self.vm_size, self.data_disks)
+
             if self.network_interface_names:
                 for name in self.network_interface_names:
                     nic = self.get_network_interface(name)
@@ -768,10 +783,9 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
 
             if self.image and isinstance(self.image, dict):
                 if all(key in self.image for key in ('publisher', 'offer', 'sku', 'version')):
-                    marketplace_image = self.get_marketplace_image_version()
-                    if self.image['version'] == 'latest':
-                        self.image['version'] = marketplace_image.name
-                        self.log("Using image version {0}".format(self.image['version']))
+                    self.image['version'] = self.get_marketplace_image_version()
+                    self.log("Using image version {0}".format(self.image['version']))
+                    self.results['image_version'] = self.image['version']
 
                     image_reference = self.compute_models.ImageReference(
                         publisher=self.image['publisher'],
@@ -1238,30 +1252,30 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
             result['powerstate'] = next((s.code.replace('PowerState/', '')
                                          for s in vm.instance_view.statuses if s.code.startswith('PowerState')), None)
 
-        # Expand network interfaces to include config properties
+        # Expand network interfaces and their public IPs to include config properties. Every NIC is
+        # fetched once, with its public IPs expanded, and all NICs are fetched concurrently.
+        nic_ids = []
         for interface in vm.network_profile.network_interfaces:
-            int_dict = azure_id_to_dict(interface.id)
-            nic = self.get_network_interface(int_dict['networkInterfaces'])
-            for interface_dict in result['properties']['networkProfile']['networkInterfaces']:
-                if interface_dict['id'] == interface.id:
-                    nic_dict = self.serialize_obj(nic, 'NetworkInterface')
-                    interface_dict['name'] = int_dict['networkInterfaces']
-                    interface_dict['properties'] = nic_dict['properties']
-
-        # Expand public IPs to include config properties
-        for interface in result['properties']['networkProfile']['networkInterfaces']:
-            for config in interface['properties']['ipConfigurations']:
+            if interface.id not in nic_ids:
+                nic_ids.append(interface.id)
+        # create the client before using it from several threads
+        self.network_client
+        nics = dict(zip(nic_ids, parallel_map(self.get_network_interface_by_id, nic_ids)))
+
+        for interface_dict in result['properties']['networkProfile']['networkInterfaces']:
+            if interface_dict['id'] not in nics:
+                continue
+            nic, error = nics[interface_dict['id']]
+            int_dict = azure_id_to_dict(interface_dict['id'])
+            if error:
+                self.fail("Error fetching network interface {0} - {1}".format(int_dict['networkInterfaces'], error))
+            nic_dict = self.serialize_obj(nic, 'NetworkInterface')
+            interface_dict['name'] = int_dict['networkInterfaces']
+            interface_dict['properties'] = nic_dict['properties']
+            for config in interface_dict['properties']['ipConfigurations']:
                 if config['properties'].get('publicIPAddress'):
                     pipid_dict = azure_id_to_dict(config['properties']['publicIPAddress']['id'])
-                    try:
-                        pip = self.network_client.public_ip_addresses.get(self.resource_group,
-                                                                          pipid_dict['publicIPAddresses'])
-                    except Exception as exc:
-                        self.fail("Error fetching public ip {0} - {1}".format(pipid_dict['publicIPAddresses'],
-                                                                              str(exc)))
-                    pip_dict = self.serialize_obj(pip, 'PublicIPAddress')
                     config['properties']['publicIPAddress']['name'] = pipid_dict['publicIPAddresses']
-                    config['properties']['publicIPAddress']['properties'] = pip_dict['properties']
 
         self.log(result, pretty_print=True)
         if self.state != 'absent' and not result['powerstate']:
@@ -1356,31 +1370,40 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
                 self.results['deleted_public_ips'] = pip_names
 
         self.log("Deleting virtual machine {0}".format(self.name))
-        self.results['actions'].append("Deleted virtual machine {0}".format(self.name))
         try:
             poller = self.compute_client.virtual_machines.delete(self.resource_group, self.name)
             # wait for the poller to finish
             self.get_poller_result(poller)
         except Exception as exc:
             self.fail("Error deleting virtual machine {0} - {1}".format(self.name, str(exc)))
+        self.results['actions'].append("Deleted virtual machine {0}".format(self.name))
 
-        # TODO: parallelize nic, vhd, and public ip deletions with begin_deleting
-        # TODO: best-effort to keep deleting other linked resources if we encounter an error
+        # start all independent deletions together and wait for them as a group, keep going when one of them fails
+        storage_deletions = []
+        nic_deletions = []
         if self.remove_on_absent.intersection(set(['all', 'virtual_storage'])):
             self.log('Deleting VHDs')
-            self.delete_vm_storage(vhd_uris)
+            storage_deletions += self.delete_vm_storage(vhd_uris)
             self.log('Deleting managed disks')
-            self.delete_managed_disks(managed_disk_ids)
+            storage_deletions += self.delete_managed_disks(managed_disk_ids)
 
         if self.remove_on_absent.intersection(set(['all', 'network_interfaces'])):
             self.log('Deleting network interfaces')
-            for name in nic_names:
-                self.delete_nic(name)
+            nic_deletions = [self.delete_nic(name) for name in nic_names]
 
+        # public IPs can only be deleted once the network interfaces using them are gone
+        deletions = self.wait_for_deletions(nic_deletions)
         if self.remove_on_absent.intersection(set(['all', 'public_ips'])):
             self.log('Deleting public IPs')
-            for name in pip_names:
-                self.delete_pip(name)
+            deletions += self.wait_for_deletions([self.delete_pip(name) for name in pip_names])
+        deletions += self.wait_for_deletions(storage_deletions)
+
+        self.results['deleted_resources'] = deletions
+        failed = [deletion for deletion in deletions if not deletion['deleted']]
+        if failed:
+            self.fail("Error deleting resources of virtual machine {0} - {1}".format(
+                self.name, '; '.join("{0} {1}: {2}".format(d['type'], d['name'], d['msg']) for d in failed)),
+                deleted_resources=deletions)
         return True
 
     def get_network_interface(self, name):
@@ -1390,92 +1413,120 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
         except Exception as exc:
             self.fail("Error fetching network interface {0} - {1}".format(name, str(exc)))
 
-    def delete_nic(self, name):
-        self.log("Deleting network interface {0}".format(name))
-        self.results['actions'].append("Deleted network interface {0}".format(name))
+    def get_network_interface_by_id(self, nic_id):
+        '''
+        Fetch a network interface with its public IP addresses expanded. Safe to call from worker threads.
+
+        :param nic_id: network interface resource id
+        :return: tuple of network interface object and error message
+        '''
+        id_dict = azure_id_to_dict(nic_id)
+        resource_group = id_dict.get('resourceGroups') or id_dict.get('resourcegroups') or self.resource_group
         try:
-            poller = self.network_client.network_interfaces.delete(self.resource_group, name)
+            nic = self.network_client.network_interfaces.get(resource_group,
+                                                             id_dict['networkInterfaces'],
+                                                             expand='ipConfigurations/publicIPAddress')
+            return nic, None
         except Exception as exc:
-            self.fail("Error deleting network interface {0} - {1}".format(name, str(exc)))
-        self.get_poller_result(poller)
-        # Delete doesn't return anything. If we get this far, assume success
-        return True
+            return None, str(exc)
 
-    def delete_pip(self, name):
-        self.results['actions'].append("Deleted public IP {0}".format(name))
+    def begin_delete(self, resource_type, name, delete, description=None):
+        '''
+        Start deleting a resource without waiting for it.
+
+        :param resource_type: type of the resource, used in results
+        :param name: name of the resource
+        :param delete: callable starting the deletion, returning a poller or None if it completed already
+        :param description: description of the resource in actions, defaults to type and name
+        :return: deletion to pass to wait_for_deletions
+        '''
+        self.log("Deleting {0} {1}".format(resource_type, name))
+        deletion = dict(type=resource_type, name=name, poller=None, error=None,
+                        description=description or "{0} {1}".format(resource_type.replace('_', ' '), name))
         try:
-            poller = self.network_client.public_ip_addresses.delete(self.resource_group, name)
-            self.get_poller_result(poller)
+            deletion['poller'] = delete()
         except Exception as exc:
-            self.fail("Error deleting {0} - {1}".format(name, str(exc)))
-        # Delete returns nada. If we get here, assume that all is well.
-        return True
+            deletion['error'] = str(exc)
+        return deletion
+
+    def wait_for_deletions(self, deletions):
+        '''
+        Wait for deletions started with begin_delete, which run concurrently in Azure.
+
+        :return: list of dicts with type, name, deleted and msg of every deletion
+        '''
+        results = []
+        for deletion in deletions:
+            if deletion['poller'] is not None and not deletion['error']:
+                try:
+                    self.get_poller_result(deletion['poller'])
+                except Exception as exc:
+                    deletion['error'] = str(exc)
+            result = dict(type=deletion['type'], name=deletion['name'], deleted=not deletion['error'])
+            if deletion['error']:
+                result['msg'] = deletion['error']
+            else:
+                self.results['actions'].append("Deleted {0}".format(deletion['description']))
+            results.append(result)
+        return results
+
+    def delete_nic(self, name):
+        return self.begin_delete('network_interface', name,
+                                 lambda: self.network_client.network_interfaces.delete(self.resource_group, name))
+
+    def delete_pip(self, name):
+        return self.begin_delete('public_ip', name,
+                                 lambda: self.network_client.public_ip_addresses.delete(self.resource_group, name),
+                                 description="public IP {0}".format(name))
 
     def delete_managed_disks(self, managed_disk_ids):
-        for mdi in managed_disk_ids:
-            try:
-                poller = self.rm_client.resources.delete_by_id(mdi, '2017-03-30')
-                self.get_poller_result(poller)
-            except Exception as exc:
-                self.fail("Error deleting managed disk {0} - {1}".format(mdi, str(exc)))
+        return [self.begin_delete('managed_disk', mdi, lambda mdi=mdi: self.rm_client.resources.delete_by_id(mdi, '2017-03-30'))
+                for mdi in managed_disk_ids]
 
     def delete_vm_storage(self, vhd_uris):
         # FUTURE: figure out a cloud_env indepdendent way to delete these
-        for uri in vhd_uris:
-            self.log("Extracting info from blob uri '{0}'".format(uri))
-            try:
-                blob_parts = extract_names_from_blob_uri(uri, self._cloud_environment.suffixes.storage_endpoint)
-            except Exception as exc:
-                self.fail("Error parsing blob URI {0}".format(str(exc)))
-            storage_account_name = blob_parts['accountname']
-            container_name = blob_parts['containername']
-            blob_name = blob_parts['blobname']
-
-            blob_client = self.get_blob_client(self.resource_group, storage_account_name)
-
-            self.log("Delete blob {0}:{1}".format(container_name, blob_name))
-            self.results['actions'].append("Deleted blob {0}:{1}".format(container_name, blob_name))
-            try:
-                blob_client.delete_blob(container_name, blob_name)
-            except Exception as exc:
-                self.fail("Error deleting blob {0}:{1} - {2}".format(container_name, blob_name, str(exc)))
+        # blob deletion is synchronous, so blobs are deleted in parallel; clients are created upfront, once per account
+        return parallel_map(lambda vhd: vhd if vhd.get('error') else self.delete_vhd(vhd),
+                            [self.get_vhd(uri) for uri in vhd_uris])
 
-    def get_marketplace_image_version(self):
+    def get_vhd(self, uri):
+        '''
+        Resolve a VHD URI to its blob client, container and blob, or to a failed deletion.
+        '''
+        self.log("Extracting info from blob uri '{0}'".format(uri))
         try:
-            versions = self.compute_client.virtual_machine_images.list(self.location,
-                                                                       self.image['publisher'],
-                                                                       self.image['offer'],
-                                                                       self.image['sku'])
+            blob_parts = extract_names_from_blob_uri(uri, self._cloud_environment.suffixes.storage_endpoint)
         except Exception as exc:
-            self.fail("Error fetching image {0} {1} {2} - {3}".format(self.image['publisher'],
-                                                                      self.image['offer'],
-                                                                      self.image['sku'],
-                                                                      str(exc)))
-        if versions and len(versions) > 0:
-            if self.image['version'] == 'latest':
-                return versions[len(versions) - 1]
-            for version in versions:
-                if version.name == self.image['version']:
-                    return version
-
-        self.fail("Error could not find image {0} {1} {2} {3}".format(self.image['publisher'],
-                                                                      self.image['offer'],
-                                                                      self.image['sku'],
-                                                                      self.image['version']))
-
-    def get_custom_image_reference(self, name, resource_group=None):
+            return dict(type='vhd', name=uri, poller=None, error="Error parsing blob URI {0}".format(str(exc)))
         try:
-            if resource_group:
-                vm_images = self.compute_client.images.list_by_resource_group(resource_group)
-            else:
-                vm_images = self.compute_client.images.list()
+            blob_client = self.get_blob_service(self.resource_group, blob_parts['accountname'])
         except Exception as exc:
-            self.fail("Error fetching custom images from subscription - {0}".format(str(exc)))
+            return dict(type='vhd', name=uri, poller=None, error=str(exc))
+        return dict(uri=uri, blob_client=blob_client, container=blob_parts['containername'], blob=blob_parts['blobname'])
 
-        for vm_image in vm_images:
-            if vm_image.name == name:
-                self.log("Using custom image id {0}".format(vm_image.id))
-                return self.compute_models.ImageReference(id=vm_image.id)
+    def delete_vhd(self, vhd):
+        # runs on a worker thread, begin_delete reports errors in the deletion
+        return self.begin_delete('vhd', vhd['uri'], lambda: vhd['blob_client'].delete_blob(vhd['container'], vhd['blob']),
+                                 description="blob {0}:{1}".format(vhd['container'], vhd['blob']))
+
+    def get_marketplace_image_version(self):
+        version = self.resolve_image_version(self.location,
+                                             self.image['publisher'],
+                                             self.image['offer'],
+                                             self.image['sku'],
+                                             self.image['version'])
+        if version is None:
+            self.fail("Error could not find image {0} {1} {2} {3}".format(self.image['publisher'],
+                                                                          self.image['offer'],
+                                                                          self.image['sku'],
+                                                                          self.image['version']))
+        return version
+
+    def get_custom_image_reference(self, name, resource_group=None):
+        image_id = self.get_custom_image_id(name, resource_group)
+        if image_id:
+            self.log("Using custom image id {0}".format(image_id))
+            return self.compute_models.ImageReference(id=image_id)
 
         self.fail("Error could not find image with name {0}".format(name))
 
@@ -1506,14 +1557,7 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
 
         :return: boolean
         '''
-        try:
-            sizes = self.compute_client.virtual_machine_sizes.list(self.location)
-        except Exception as exc:
-            self.fail("Error retrieving available machine sizes - {0}".format(str(exc)))
-        for size in sizes:
-            if size.name == self.vm_size:
-                return True
-        return False
+        return self.get_vm_size(self.location, self.vm_size) is not None
 
     def create_default_storage_account(self):
         '''
@@ -183,6 +183,13 @@ options:
             - "It can be 'all' or a list with any of the following: ['network_interfaces', 'virtual_storage', 'public_ips']."
             - Any other input will be ignored.
         default: ['all']
+    wait:
+        description:
+            - Wait for the long running operation to complete.
+            - With C(no) the module returns right away with I(operation), use M(azure_rm_operation_facts) to poll it.
+        type: bool
+        default: yes
+        version_added: "2.8"
 
 extends_documentation_fragment:
     - azure
@@ -249,6 +256,11 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+image_version:
+    description: Marketplace image version the scale set is created from, with C(latest) resolved.
+    returned: when I(image) is a marketplace image and I(state=present)
+    type: string
+    example: 16.04.201808140
 azure_vmss:
     description: Facts about the current state of the object. Note that facts are not part of the registered output but available directly.
     returned: always
@@ -338,6 +350,18 @@ azure_vmss:
         "tags": null,
         "type": "Microsoft.Compute/virtualMachineScaleSets"
     }
+operation:
+    description:
+        - Handle of the running operation, poll it with M(azure_rm_operation_facts).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample:
+        id: "/subscriptions/XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX/resourceGroups/Testing/providers/Microsoft.Compute/\\
+             virtualMachineScaleSets/testvmss"
+        method: PUT
+        api_version: "2017-03-30"
+        status_url: "https://management.azure.com/subscriptions/XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX/providers/\\
+                     Microsoft.Compute/locations/eastus/operations/..."
 '''  # NOQA
 
 import random
@@ -388,6 +412,7 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
             virtual_network_resource_group=dict(type='str'),
             virtual_network_name=dict(type='str', aliases=['virtual_network']),
             remove_on_absent=dict(type='list', default=['all']),
+            wait=dict(type='bool', default=True),
         )
 
         self.resource_group = None
@@ -414,6 +439,7 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         self.tags = None
         self.differences = None
         self.load_balancer = None
+        self.wait = None
 
         self.results = dict(
             changed=False,
@@ -461,6 +487,9 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
                     self.vm_size
                 ))
 
+            if self.vm_size and self.data_disks:
+                self.check_data_disk_count(self.location, self.vm_size, self.data_disks)
+
             # if self.virtual_network_name:
             #     virtual_network = self.get_virtual_network(self.virtual_network_name)
 
@@ -475,10 +504,9 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
 
             if self.image and isinstance(self.image, dict):
                 if all(key in self.image for key in ('publisher', 'offer', 'sku', 'version')):
-                    marketplace_image = self.get_marketplace_image_version()
-                    if self.image['version'] == 'latest':
-                        self.image['version'] = marketplace_image.name
-                        self.log("Using image version {0}".format(self.image['version']))
+                    self.image['version'] = self.get_marketplace_image_version()
+                    self.log("Using image version {0}".format(self.image['version']))
+                    self.results['image_version'] = self.image['version']
 
                     image_reference = self.compute_models.ImageReference(
                         publisher=self.image['publisher'],
@@ -779,6 +807,8 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         self.results['actions'].append("Deleted virtual machine scale set {0}".format(self.name))
         try:
             poller = self.compute_client.virtual_machine_scale_sets.delete(self.resource_group, self.name)
+            if not self.wait:
+                self.exit_with_operation(poller)
             # wait for the poller to finish
             self.get_poller_result(poller)
         except CloudError as exc:
@@ -787,47 +817,31 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         return True
 
     def get_marketplace_image_version(self):
-        try:
-            versions = self.compute_client.virtual_machine_images.list(self.location,
-                                                                       self.image['publisher'],
-                                                                       self.image['offer'],
-                                                                       self.image['sku'])
-        except CloudError as exc:
-            self.fail("Error fetching image {0} {1} {2} - {3}".format(self.image['publisher'],
-                                                                      self.image['offer'],
-                                                                      self.image['sku'],
-                                                                      str(exc)))
-        if versions and len(versions) > 0:
-            if self.image['version'] == 'latest':
-                return versions[len(versions) - 1]
-            for version in versions:
-                if version.name == self.image['version']:
-                    return version
-
-        self.fail("Error could not find image {0} {1} {2} {3}".format(self.image['publisher'],
-                                                                      self.image['offer'],
-                                                                      self.image['sku'],
-                                                                      self.image['version']))
+        version = self.resolve_image_version(self.location,
+                                             self.image['publisher'],
+                                             self.image['offer'],
+                                             self.image['sku'],
+                                             self.image['version'])
+        if version is None:
+            self.fail("Error could not find image {0} {1} {2} {3}".format(self.image['publisher'],
+                                                                          self.image['offer'],
+                                                                          self.image['sku'],
+                                                                          self.image['version']))
+        return version
 
     def get_custom_image_reference(self, name, resource_group=None):
-        try:
-            if resource_group:
-                vm_images = self.compute_client.images.list_by_resource_group(resource_group)
-            else:
-                vm_images = self.compute_client.images.list()
-        except Exception as exc:
-            self.fail("Error fetching custom images from subscription - {0}".format(str(exc)))
-
-        for vm_image in vm_images:
-            if vm_image.name == name:
-                self.log("Using custom image id {0}".format(vm_image.id))
-                return self.compute_models.ImageReference(id=vm_image.id)
+        image_id = self.get_custom_image_id(name, resource_group)
+        if image_id:
+            self.log("Using custom image id {0}".format(image_id))
+            return self.compute_models.ImageReference(id=image_id)
 
         self.fail("Error could not find image with name {0}".format(name))
 
     def create_or_update_vmss(self, params):
         try:
             poller = self.compute_client.virtual_machine_scale_sets.create_or_update(self.resource_group, self.name, params)
+            if not self.wait:
+                self.exit_with_operation(poller)
             self.get_poller_result(poller)
         except CloudError as exc:
             self.fail("Error creating or updating virtual machine {0} - {1}".format(self.name, str(exc)))
@@ -838,14 +852,7 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
 
         :return: boolean
         '''
-        try:
-            sizes = self.compute_client.virtual_machine_sizes.list(self.location)
-        except CloudError as exc:
-            self.fail("Error retrieving available machine sizes - {0}".format(str(exc)))
-        for size in sizes:
-            if size.name == self.vm_size:
-                return True
-        return False
+        return self.get_vm_size(self.location, self.vm_size) is not None
 
 
 def main():
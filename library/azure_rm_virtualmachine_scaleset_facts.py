@@ -46,6 +46,7 @@ options:
 
 extends_documentation_fragment:
     - azure
+    - azure_facts
 
 author:
     - "Sertac Ozercan (@sozercan)"
@@ -108,11 +109,11 @@ azure_vmss:
     }]
 '''  # NOQA
 
-from ansible.module_utils.azure_rm_common import AzureRMModuleBase
-import re
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, project_fields
 
 try:
     from msrestazure.azure_exceptions import CloudError
+    from msrestazure.tools import parse_resource_id
 except:
     # handled in azure_rm_common
     pass
@@ -169,71 +170,6 @@ class AzureRMVirtualMachineScaleSetFacts(AzureRMModuleBase):
         else:
             self.results['ansible_facts']['azure_vmss'] = self.list_items()
 
-        if self.format == 'curated':
-            for index in range(len(self.results['ansible_facts']['azure_vmss'])):
-                vmss = self.results['ansible_facts']['azure_vmss'][index]
-                subnet_name = None
-                load_balancer_name = None
-                virtual_network_name = None
-                ssh_password_enabled = False
-
-                try:
-                    subnet_id = (vmss['properties']['virtualMachineProfile']['networkProfile']['networkInterfaceConfigurations'][0]
-                                 ['properties']['ipConfigurations'][0]['properties']['subnet']['id'])
-                    subnet_name = re.sub('.*subnets\\/', '', subnet_id)
-                except:
-                    self.log('Could not extract subnet name')
-
-                try:
-                    backend_address_pool_id = (vmss['properties']['virtualMachineProfile']['networkProfile']['networkInterfaceConfigurations'][0]
-                                               ['properties']['ipConfigurations'][0]['properties']['loadBalancerBackendAddressPools'][0]['id'])
-                    load_balancer_name = re.sub('\\/backendAddressPools.*', '', re.sub('.*loadBalancers\\/', '', backend_address_pool_id))
-                    virtual_network_name = re.sub('.*virtualNetworks\\/', '', re.sub('\\/subnets.*', '', subnet_id))
-                except:
-                    self.log('Could not extract load balancer / virtual network name')
-
-                try:
-                    ssh_password_enabled = (not vmss['properties']['virtualMachineProfile']['osProfile'],
-                                                    ['linuxConfiguration']['disablePasswordAuthentication'])
-                except:
-                    self.log('Could not extract SSH password enabled')
-
-                data_disks = vmss['properties']['virtualMachineProfile']['storageProfile'].get('dataDisks', [])
-
-                for disk_index in range(len(data_disks)):
-                    old_disk = data_disks[disk_index]
-                    new_disk = {
-                        'lun': old_disk['lun'],
-                        'disk_size_gb': old_disk['diskSizeGB'],
-                        'managed_disk_type': old_disk['managedDisk']['storageAccountType'],
-                        'caching': old_disk['caching']
-                    }
-                    data_disks[disk_index] = new_disk
-
-                updated = {
-                    'resource_group': self.resource_group,
-                    'name': vmss['name'],
-                    'state': 'present',
-                    'location': vmss['location'],
-                    'vm_size': vmss['sku']['name'],
-                    'capacity': vmss['sku']['capacity'],
-                    'tier': vmss['sku']['tier'],
-                    'upgrade_policy': vmss['properties']['upgradePolicy']['mode'],
-                    'admin_username': vmss['properties']['virtualMachineProfile']['osProfile']['adminUsername'],
-                    'admin_password': vmss['properties']['virtualMachineProfile']['osProfile'].get('adminPassword'),
-                    'ssh_password_enabled': ssh_password_enabled,
-                    'image': vmss['properties']['virtualMachineProfile']['storageProfile']['imageReference'],
-                    'os_disk_caching': vmss['properties']['virtualMachineProfile']['storageProfile']['osDisk']['caching'],
-                    'os_type': 'Linux' if (vmss['properties']['virtualMachineProfile']['osProfile'].get('linuxConfiguration') is not None) else 'Windows',
-                    'managed_disk_type': vmss['properties']['virtualMachineProfile']['storageProfile']['osDisk']['managedDisk']['storageAccountType'],
-                    'data_disks': data_disks,
-                    'virtual_network_name': virtual_network_name,
-                    'subnet_name': subnet_name,
-                    'load_balancer': load_balancer_name
-                }
-
-                self.results['ansible_facts']['azure_vmss'][index] = updated
-
         return self.results
 
     def get_item(self):
@@ -250,7 +186,7 @@ class AzureRMVirtualMachineScaleSetFacts(AzureRMModuleBase):
             pass
 
         if item and self.has_tags(item.tags, self.tags):
-            results = [self.serialize_obj(item, AZURE_OBJECT_CLASS, enum_modules=AZURE_ENUM_MODULES)]
+            results = [self.format_item(item)]
 
         return results
 
@@ -267,10 +203,73 @@ class AzureRMVirtualMachineScaleSetFacts(AzureRMModuleBase):
         results = []
         for item in response:
             if self.has_tags(item.tags, self.tags):
-                results.append(self.serialize_obj(item, AZURE_OBJECT_CLASS, enum_modules=AZURE_ENUM_MODULES))
+                results.append(self.format_item(item))
 
         return results
 
+    def format_item(self, item):
+        if self.format == 'curated':
+            return project_fields(self.curated_item(item), self.fields)
+        return self.serialize_obj(item, AZURE_OBJECT_CLASS, enum_modules=AZURE_ENUM_MODULES)
+
+    def curated_item(self, item):
+        """Build the curated form, identical to the input of azure_rm_virtualmachine_scaleset, from the SDK object"""
+
+        vm_profile = item.virtual_machine_profile
+        os_profile = vm_profile.os_profile
+        storage_profile = vm_profile.storage_profile
+        os_disk = storage_profile.os_disk
+
+        subnet_name = None
+        virtual_network_name = None
+        load_balancer_name = None
+        try:
+            ip_configuration = vm_profile.network_profile.network_interface_configurations[0].ip_configurations[0]
+            subnet = parse_resource_id(ip_configuration.subnet.id)
+            subnet_name = subnet.get('resource_name')
+            virtual_network_name = subnet.get('name')
+            if ip_configuration.load_balancer_backend_address_pools:
+                load_balancer_name = parse_resource_id(ip_configuration.load_balancer_backend_address_pools[0].id).get('name')
+        except (AttributeError, IndexError, TypeError):
+            self.log('Could not extract subnet / load balancer / virtual network name')
+
+        data_disks = []
+        for disk in storage_profile.data_disks or []:
+            data_disks.append({
+                'lun': disk.lun,
+                'disk_size_gb': disk.disk_size_gb,
+                'managed_disk_type': enum_value(disk.managed_disk.storage_account_type) if disk.managed_disk else None,
+                'caching': enum_value(disk.caching)
+            })
+
+        linux_configuration = os_profile.linux_configuration
+
+        return {
+            'resource_group': parse_resource_id(item.id).get('resource_group'),
+            'name': item.name,
+            'state': 'present',
+            'location': item.location,
+            'vm_size': item.sku.name,
+            'capacity': item.sku.capacity,
+            'tier': item.sku.tier,
+            'upgrade_policy': enum_value(item.upgrade_policy.mode),
+            'admin_username': os_profile.admin_username,
+            'admin_password': os_profile.admin_password,
+            'ssh_password_enabled': bool(linux_configuration and not linux_configuration.disable_password_authentication),
+            'image': storage_profile.image_reference.as_dict() if storage_profile.image_reference else None,
+            'os_disk_caching': enum_value(os_disk.caching),
+            'os_type': 'Linux' if linux_configuration is not None else 'Windows',
+            'managed_disk_type': enum_value(os_disk.managed_disk.storage_account_type) if os_disk.managed_disk else None,
+            'data_disks': data_disks,
+            'virtual_network_name': virtual_network_name,
+            'subnet_name': subnet_name,
+            'load_balancer': load_balancer_name
+        }
+
+
+def enum_value(value):
+    return getattr(value, 'value', value)
+
 
 def main():
     """Main module execution code path"""
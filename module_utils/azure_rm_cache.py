@@ -0,0 +1,98 @@
+# Copyright (c) Ansible Project
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import os
+import json
+import time
+import errno
+import hashlib
+import tempfile
+
+from os.path import expanduser
+
+AZURE_CACHE_DIR_ENV = 'ANSIBLE_AZURE_CACHE_DIR'
+AZURE_DEFAULT_CACHE_DIR = '~/.ansible/azure_cache'
+
+
+def cache_key(*parts):
+    '''
+    Build a stable, opaque cache key from a list of values. Values are hashed so that
+    identifiers such as client ids or account names are not stored in clear text.
+    '''
+    raw = u'\0'.join([u'' if part is None else u'{0}'.format(part).lower() for part in parts])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class AzureRMFileCache(object):
+    '''
+    Small JSON key/value store shared by all Azure modules running on the controller.
+
+    Every named cache lives in its own file inside the cache directory
+    (ANSIBLE_AZURE_CACHE_DIR, default ~/.ansible/azure_cache). The directory is created
+    with 0700 and files with 0600 permissions. Every entry carries an absolute expiry
+    time; expired entries are never returned. Writes are atomic, so concurrent forks can
+    only lose each other's entries, never corrupt the file.
+    '''
+
+    def __init__(self, name, cache_dir=None):
+        self.cache_dir = expanduser(cache_dir or os.environ.get(AZURE_CACHE_DIR_ENV) or AZURE_DEFAULT_CACHE_DIR)
+        self.path = os.path.join(self.cache_dir, '{0}.json'.format(name))
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as cache_file:
+                data = json.load(cache_file)
+            return data if isinstance(data, dict) else dict()
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def _save(self, data):
+        try:
+            os.makedirs(self.cache_dir, 0o700)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                return False
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp')
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(data, cache_file)
+            os.rename(tmp_path, self.path)
+        except (IOError, OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def get(self, key):
+        '''
+        Return the cached value for key, or None if it is missing or expired.
+        '''
+        entry = self._load().get(key)
+        if not isinstance(entry, dict) or entry.get('expires_at', 0) <= time.time():
+            return None
+        return entry.get('value')
+
+    def set(self, key, value, ttl=None, expires_at=None):
+        '''
+        Store value under key until expires_at (epoch seconds) or for ttl seconds.
+        Returns False if the cache could not be written; callers treat that as a miss.
+        '''
+        now = time.time()
+        if expires_at is None:
+            expires_at = now + (ttl or 0)
+        if expires_at <= now:
+            return False
+        # merge with the current content to keep entries written by other forks meanwhile
+        data = dict((k, v) for k, v in self._load().items()
+                    if isinstance(v, dict) and v.get('expires_at', 0) > now)
+        data[key] = dict(value=value, expires_at=expires_at)
+        return self._save(data)
+
+    def delete(self, key):
+        data = self._load()
+        if data.pop(key, None) is not None:
+            self._save(data)
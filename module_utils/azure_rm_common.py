@@ -7,14 +7,21 @@ import os
 import re
 import types
 import copy
+import time
+import base64
+import hashlib
+import random
 import inspect
+import threading
 import traceback
 
 from os.path import expanduser
+from multiprocessing.pool import ThreadPool
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six.moves import configparser
 import ansible.module_utils.six.moves.urllib.parse as urlparse
+from ansible.module_utils.azure_rm_cache import AzureRMFileCache, cache_key
 try:
     from ansible.release import __version__ as ANSIBLE_VERSION
 except ImportError:
@@ -36,7 +43,9 @@ AZURE_COMMON_ARGS = dict(
     cloud_environment=dict(type='str', default='AzureCloud'),
     cert_validation_mode=dict(type='str', choices=['validate', 'ignore']),
     api_profile=dict(type='str', default='latest'),
-    adfs_authority_url=dict(type='str', default=None)
+    adfs_authority_url=dict(type='str', default=None),
+    poll_interval=dict(type='float'),
+    poll_timeout=dict(type='int')
     # debug=dict(type='bool', default=False),
 )
 
@@ -83,6 +92,10 @@ AZURE_TAG_ARGS = dict(
     append_tags=dict(type='bool', default=True),
 )
 
+AZURE_FACTS_ARGS = dict(
+    fields=dict(type='list'),
+)
+
 AZURE_COMMON_REQUIRED_IF = [
     ('log_mode', 'file', ['log_path'])
 ]
@@ -91,6 +104,44 @@ ANSIBLE_USER_AGENT = 'Ansible/{0}'.format(ANSIBLE_VERSION)
 CLOUDSHELL_USER_AGENT_KEY = 'AZURE_HTTP_USER_AGENT'
 VSCODEEXT_USER_AGENT_KEY = 'VSCODEEXT_USER_AGENT'
 
+# opt-in on-disk AAD token cache shared by all modules on the controller
+AZURE_TOKEN_CACHE_ENV = 'ANSIBLE_AZURE_TOKEN_CACHE'
+# cached tokens are considered expired this many seconds before their real expiry
+AZURE_TOKEN_REFRESH_MARGIN_ENV = 'ANSIBLE_AZURE_TOKEN_REFRESH_MARGIN'
+AZURE_TOKEN_REFRESH_MARGIN = 300
+
+# long running operations are polled after AZURE_POLL_INTERVAL seconds first, then with exponential
+# backoff and jitter up to AZURE_POLL_MAX_INTERVAL; a Retry-After header sent by Azure takes precedence
+AZURE_POLL_INTERVAL = 1
+AZURE_POLL_BACKOFF = 1.5
+AZURE_POLL_MAX_INTERVAL = 15
+
+# catalogues of VM sizes are cached on the controller per subscription and location
+AZURE_VM_SIZE_CACHE_TTL_ENV = 'ANSIBLE_AZURE_VM_SIZE_CACHE_TTL'
+AZURE_VM_SIZE_CACHE_TTL = 86400
+
+# default upper bound for wait_until_gone when poll_timeout is not set
+AZURE_DELETE_TIMEOUT = 1800
+
+# marketplace image versions are cached on the controller per location, publisher, offer and sku
+AZURE_IMAGE_CACHE_TTL_ENV = 'ANSIBLE_AZURE_IMAGE_CACHE_TTL'
+AZURE_IMAGE_CACHE_TTL = 3600
+
+# name to id index of the custom images of a subscription
+AZURE_CUSTOM_IMAGE_CACHE_TTL_ENV = 'ANSIBLE_AZURE_CUSTOM_IMAGE_CACHE_TTL'
+AZURE_CUSTOM_IMAGE_CACHE_TTL = 3600
+
+# storage account keys are cached on the controller, encrypted with a secret taken from
+# ANSIBLE_AZURE_STORAGE_KEY_CACHE_SECRET; the cache is only used if the secret is set
+AZURE_STORAGE_KEY_CACHE_SECRET_ENV = 'ANSIBLE_AZURE_STORAGE_KEY_CACHE_SECRET'
+AZURE_STORAGE_KEY_CACHE_TTL_ENV = 'ANSIBLE_AZURE_STORAGE_KEY_CACHE_TTL'
+AZURE_STORAGE_KEY_CACHE_TTL = 900
+
+# HTTP connection pool shared by all management clients of a module
+AZURE_HTTP_POOL_SIZE_ENV = 'ANSIBLE_AZURE_HTTP_POOL_SIZE'
+AZURE_HTTP_POOL_SIZE = 10
+AZURE_HTTP_KEEP_ALIVE_ENV = 'ANSIBLE_AZURE_HTTP_KEEP_ALIVE'
+
 CIDR_PATTERN = re.compile(r"(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1"
                           r"[0-9]{2}|2[0-4][0-9]|25[0-5])(/([0-9]|[1-2][0-9]|3[0-2]))")
 
@@ -135,26 +186,19 @@ try:
     from msrestazure.tools import parse_resource_id, resource_id, is_valid_resource_id
     from msrestazure import azure_cloud
     from azure.common.credentials import ServicePrincipalCredentials, UserPassCredentials
-    from azure.mgmt.network.version import VERSION as network_client_version
-    from azure.mgmt.storage.version import VERSION as storage_client_version
-    from azure.mgmt.compute.version import VERSION as compute_client_version
-    from azure.mgmt.resource.version import VERSION as resource_client_version
-    from azure.mgmt.dns.version import VERSION as dns_client_version
-    from azure.mgmt.web.version import VERSION as web_client_version
-    from azure.mgmt.network import NetworkManagementClient
-    from azure.mgmt.resource.resources import ResourceManagementClient
-    from azure.mgmt.resource.subscriptions import SubscriptionClient
-    from azure.mgmt.storage import StorageManagementClient
-    from azure.mgmt.compute import ComputeManagementClient
-    from azure.mgmt.dns import DnsManagementClient
-    from azure.mgmt.web import WebSiteManagementClient
-    from azure.mgmt.containerservice import ContainerServiceClient
-    from azure.storage.cloudstorageaccount import CloudStorageAccount
-    from adal.authentication_context import AuthenticationContext
 except ImportError as exc:
     HAS_AZURE_EXC = exc
     HAS_AZURE = False
 
+try:
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    # requests comes with msrest, this is handled above
+    HTTPAdapter = object
+
+# Management clients, CloudStorageAccount and adal are imported on first use (see import_sdk),
+# so that a module only pays the import cost of the SDK packages it actually uses.
+
 try:
     from azure.cli.core.util import CLIError
     from azure.common.credentials import get_azure_cli_credentials, get_cli_profile
@@ -186,6 +230,171 @@ def normalize_location_name(name):
     return name.replace(' ', '').lower()
 
 
+def parallel_map(func, items, concurrency=5):
+    '''
+    Apply func to every item on at most concurrency threads and return the results in input order.
+    Exceptions raised by func propagate, so func should catch and report per-item errors itself.
+    func must not call fail() or exit the module, as that would not return from a worker thread.
+    '''
+    items = list(items)
+    if concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    pool = ThreadPool(min(concurrency, len(items)))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def field_tree(fields):
+    '''
+    Turn a list of dotted field paths, e.g. ['name', 'properties.provisioningState'], into a tree of dicts.
+    An empty dict selects the whole value, so 'properties' wins over 'properties.provisioningState'.
+    '''
+    if not fields:
+        return None
+    tree = dict()
+    for field in fields:
+        node = tree
+        parts = field.split('.')
+        for index, part in enumerate(parts):
+            if part in node and not node[part]:
+                break
+            if index == len(parts) - 1:
+                node[part] = dict()
+            else:
+                node = node.setdefault(part, dict())
+    return tree
+
+
+def project_fields(data, tree):
+    '''
+    Keep only the fields of a field_tree in serialized data. Lists are projected item by item.
+    '''
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [project_fields(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return None
+    return dict((key, project_fields(data[key], subtree)) for key, subtree in tree.items() if key in data)
+
+
+def serialize_fields(serializer, obj, tree):
+    '''
+    Serialize only the fields of a field_tree of an msrest model, without serializing the rest of it.
+    Field paths use the serialized (REST API) names.
+    '''
+    if isinstance(obj, list):
+        return [serialize_fields(serializer, item, tree) for item in obj]
+    if not hasattr(obj, '_attribute_map'):
+        # plain values have no fields
+        return None
+    result = dict()
+    for attr, attr_desc in obj._attribute_map.items():
+        keys = [key.replace('\\.', '.') for key in re.split(r'(?<!\\)\.', attr_desc['key'])]
+        node = tree
+        for key in keys:
+            node = node.get(key)
+            if not node:
+                break
+        if node is None:
+            continue
+        value = getattr(obj, attr, None)
+        if value is None:
+            continue
+        if node:
+            # the requested path continues below this attribute
+            data = serialize_fields(serializer, value, node) if not isinstance(value, dict) else \
+                project_fields(serializer.serialize_data(value, attr_desc['type'], keep_readonly=True), node)
+        else:
+            data = serializer.serialize_data(value, attr_desc['type'], keep_readonly=True)
+        target = result
+        for key in keys[:-1]:
+            target = target.setdefault(key, dict())
+        target[keys[-1]] = data
+    return result
+
+
+def image_version_key(version):
+    '''
+    Sort key for marketplace image versions such as 16.04.201808140, comparing numeric parts as numbers.
+    '''
+    return tuple((0, int(part), '') if part.isdigit() else (1, 0, part) for part in re.split(r'[.\-]', version))
+
+
+def cache_ttl(env_name, default):
+    try:
+        return int(os.environ.get(env_name, default))
+    except ValueError:
+        return default
+
+
+def storage_key_cipher():
+    '''
+    Return the Fernet cipher of the storage account key cache, derived from the secret in
+    ANSIBLE_AZURE_STORAGE_KEY_CACHE_SECRET, or None if no secret is set or cryptography is missing.
+    '''
+    secret = os.environ.get(AZURE_STORAGE_KEY_CACHE_SECRET_ENV)
+    if not secret:
+        return None
+    try:
+        # cryptography comes with azure-storage
+        from cryptography.fernet import Fernet
+    except ImportError:
+        return None
+    key = hashlib.pbkdf2_hmac('sha256', secret.encode('utf-8'), b'ansible-azure-storage-keys', 100000)
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def next_poll_delay(delay, max_interval=AZURE_POLL_MAX_INTERVAL):
+    '''
+    Return the delay before the next status check: delay grown by AZURE_POLL_BACKOFF with jitter,
+    capped at max_interval.
+    '''
+    return min(delay * AZURE_POLL_BACKOFF * random.uniform(0.9, 1.1), max_interval)
+
+
+def set_poller_interval(poller, interval):
+    '''
+    Set the delay the SDK poller thread sleeps before its next status request, for both
+    msrestazure AzureOperationPoller and msrest LROPoller.
+    '''
+    # _timeout is private to the SDK: checked against msrestazure 0.6.4 (AzureOperationPoller and
+    # ARMPolling, which sleep for it between status requests) with msrest 0.7.1; pollers without it are left alone
+    target = getattr(poller, '_polling_method', poller)
+    if hasattr(target, '_timeout'):
+        target._timeout = interval
+
+
+def env_flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
+def token_expires_at(token):
+    '''
+    Return the absolute expiry (epoch seconds) of an AAD token dict, or None if it cannot be determined.
+    Handles both oauthlib style (expires_at/expires_on) and ADAL style (expiresIn) tokens.
+    '''
+    if not isinstance(token, dict):
+        return None
+    for key in ('expires_at', 'expires_on'):
+        try:
+            return float(token[key])
+        except (KeyError, TypeError, ValueError):
+            pass
+    for key in ('expires_in', 'expiresIn'):
+        try:
+            return time.time() + float(token[key])
+        except (KeyError, TypeError, ValueError):
+            pass
+    return None
+
+
 # FUTURE: either get this from the requirements file (if we can be sure it's always available at runtime)
 # or generate the requirements files from this so we only have one source of truth to maintain...
 AZURE_PKG_VERSIONS = {
@@ -222,66 +431,68 @@ AZURE_PKG_VERSIONS = {
 
 AZURE_MIN_RELEASE = '2.0.0'
 
+# Serializer per tuple of enum module names, see AzureRMModuleBase.get_serializer
+_serializer_cache = dict()
 
-class AzureRMModuleBase(object):
-    def __init__(self, derived_arg_spec, bypass_checks=False, no_log=False,
-                 check_invalid_arguments=None, mutually_exclusive=None, required_together=None,
-                 required_one_of=None, add_file_common_args=False, supports_check_mode=False,
-                 required_if=None, supports_tags=True, facts_module=False, skip_exec=False):
 
-        merged_arg_spec = dict()
-        merged_arg_spec.update(AZURE_COMMON_ARGS)
-        if supports_tags:
-            merged_arg_spec.update(AZURE_TAG_ARGS)
+class AzureRMSharedHTTPAdapter(HTTPAdapter):
+    '''
+    HTTP adapter mounted on the sessions of all management clients created by one module,
+    so that they share one connection pool (and TLS sessions) to the resource manager.
+    msrest closes sessions after each request, so close() keeps the pool alive; release() really
+    closes the pooled connections and is called when the module exits.
+    '''
 
-        if derived_arg_spec:
-            merged_arg_spec.update(derived_arg_spec)
+    def __init__(self, pool_size):
+        super(AzureRMSharedHTTPAdapter, self).__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._lock = threading.Lock()
+        self.requests = 0
 
-        merged_required_if = list(AZURE_COMMON_REQUIRED_IF)
-        if required_if:
-            merged_required_if += required_if
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests += 1
+        return super(AzureRMSharedHTTPAdapter, self).send(request, **kwargs)
 
-        self.module = AnsibleModule(argument_spec=merged_arg_spec,
-                                    bypass_checks=bypass_checks,
-                                    no_log=no_log,
-                                    check_invalid_arguments=check_invalid_arguments,
-                                    mutually_exclusive=mutually_exclusive,
-                                    required_together=required_together,
-                                    required_one_of=required_one_of,
-                                    add_file_common_args=add_file_common_args,
-                                    supports_check_mode=supports_check_mode,
-                                    required_if=merged_required_if)
+    def close(self):
+        pass
 
-        if not HAS_PACKAGING_VERSION:
-            self.fail("Do you have packaging installed? Try `pip install packaging`"
-                      "- {0}".format(HAS_PACKAGING_VERSION_EXC))
+    def release(self):
+        super(AzureRMSharedHTTPAdapter, self).close()
 
-        if not HAS_MSRESTAZURE:
-            self.fail("Do you have msrestazure installed? Try `pip install msrestazure`"
-                      "- {0}".format(HAS_MSRESTAZURE_EXC))
+    def stats(self):
+        connections = 0
+        for key in list(self.poolmanager.pools.keys()):
+            pool = self.poolmanager.pools.get(key)
+            connections += getattr(pool, 'num_connections', 0) if pool else 0
+        return dict(requests=self.requests,
+                    connections=connections,
+                    reused=max(self.requests - connections, 0))
 
-        if not HAS_AZURE:
-            self.fail("Do you have azure>={1} installed? Try `pip install ansible[azure]`"
-                      "- {0}".format(HAS_AZURE_EXC, AZURE_MIN_RELEASE))
 
+class AzureRMAuthException(Exception):
+    pass
+
+
+class AzureRMAuth(object):
+    '''
+    Resolve Azure credentials, the cloud environment and the subscription from the common Azure arguments
+    (auth_source, profile, subscription_id, client_id, secret, tenant, ad_user, password, cloud_environment,
+    cert_validation_mode and adfs_authority_url), falling back to environment variables, the credentials
+    file and Azure CLI. Used by AzureRMModuleBase and by the azure_rm inventory plugin on the controller.
+
+    fail_impl is called with the error message if authentication fails; AzureRMAuthException is raised
+    if it is not given.
+    '''
+
+    def __init__(self, fail_impl=None, **kwargs):
+        self._fail_impl = fail_impl or self._default_fail_impl
         self._cloud_environment = None
-        self._network_client = None
-        self._storage_client = None
-        self._resource_client = None
-        self._compute_client = None
-        self._dns_client = None
-        self._web_client = None
-        self._containerservice_client = None
         self._adfs_authority_url = None
         self._resource = None
+        self._token_cache = AzureRMFileCache('tokens') if env_flag(AZURE_TOKEN_CACHE_ENV) else None
+        self.azure_credentials = None
 
-        self.check_mode = self.module.check_mode
-        self.api_profile = self.module.params.get('api_profile')
-        self.facts_module = facts_module
-        # self.debug = self.module.params.get('debug')
-
-        # authenticate
-        self.credentials = self._get_credentials(self.module.params)
+        self.credentials = self._get_credentials(kwargs)
         if not self.credentials:
             if HAS_AZURE_CLI_CORE:
                 self.fail("Failed to get credentials. Either pass as parameters, set environment variables, "
@@ -291,7 +502,7 @@ class AzureRMModuleBase(object):
                           "define a profile in ~/.azure/credentials, or install Azure CLI and log in (`az login`).")
 
         # cert validation mode precedence: module-arg, credential profile, env, "validate"
-        self._cert_validation_mode = self.module.params['cert_validation_mode'] or self.credentials.get('cert_validation_mode') or \
+        self._cert_validation_mode = kwargs.get('cert_validation_mode') or self.credentials.get('cert_validation_mode') or \
             os.environ.get('AZURE_CERT_VALIDATION_MODE') or 'validate'
 
         if self._cert_validation_mode not in ['validate', 'ignore']:
@@ -341,48 +552,61 @@ class AzureRMModuleBase(object):
         elif self.credentials.get('client_id') is not None and \
                 self.credentials.get('secret') is not None and \
                 self.credentials.get('tenant') is not None:
-                self.azure_credentials = ServicePrincipalCredentials(client_id=self.credentials['client_id'],
-                                                                     secret=self.credentials['secret'],
-                                                                     tenant=self.credentials['tenant'],
-                                                                     cloud_environment=self._cloud_environment,
-                                                                     verify=self._cert_validation_mode == 'validate')
+                self.azure_credentials = self.get_cached_credentials(
+                    self.credentials['tenant'],
+                    self.credentials['client_id'],
+                    self.credentials['client_id'],
+                    lambda: ServicePrincipalCredentials(client_id=self.credentials['client_id'],
+                                                        secret=self.credentials['secret'],
+                                                        tenant=self.credentials['tenant'],
+                                                        cloud_environment=self._cloud_environment,
+                                                        verify=self._cert_validation_mode == 'validate'))
 
         elif self.credentials.get('ad_user') is not None and \
                 self.credentials.get('password') is not None and \
                 self.credentials.get('client_id') is not None and \
                 self.credentials.get('tenant') is not None:
 
-                self.azure_credentials = self.acquire_token_with_username_password(
-                    self._adfs_authority_url,
-                    self._resource,
+                self.azure_credentials = self.get_cached_credentials(
+                    self.credentials['tenant'],
                     self.credentials['ad_user'],
-                    self.credentials['password'],
                     self.credentials['client_id'],
-                    self.credentials['tenant'])
+                    lambda: self.acquire_token_with_username_password(
+                        self._adfs_authority_url,
+                        self._resource,
+                        self.credentials['ad_user'],
+                        self.credentials['password'],
+                        self.credentials['client_id'],
+                        self.credentials['tenant']))
 
         elif self.credentials.get('ad_user') is not None and self.credentials.get('password') is not None:
             tenant = self.credentials.get('tenant')
             if not tenant:
                 tenant = 'common'  # SDK default
 
-            self.azure_credentials = UserPassCredentials(self.credentials['ad_user'],
-                                                         self.credentials['password'],
-                                                         tenant=tenant,
-                                                         cloud_environment=self._cloud_environment,
-                                                         verify=self._cert_validation_mode == 'validate')
+            self.azure_credentials = self.get_cached_credentials(
+                tenant,
+                self.credentials['ad_user'],
+                None,
+                lambda: UserPassCredentials(self.credentials['ad_user'],
+                                            self.credentials['password'],
+                                            tenant=tenant,
+                                            cloud_environment=self._cloud_environment,
+                                            verify=self._cert_validation_mode == 'validate'))
         else:
             self.fail("Failed to authenticate with provided credentials. Some attributes were missing. "
                       "Credentials must include client_id, secret and tenant or ad_user and password, or "
                       "ad_user, password, client_id, tenant and adfs_authority_url(optional) for ADFS authentication, or "
                       "be logged in using AzureCLI.")
 
-        # common parameter validation
-        if self.module.params.get('tags'):
-            self.validate_tags(self.module.params['tags'])
+    def _default_fail_impl(self, msg, **kwargs):
+        raise AzureRMAuthException(msg)
 
-        if not skip_exec:
-            res = self.exec_module(**self.module.params)
-            self.module.exit_json(**res)
+    def fail(self, msg, **kwargs):
+        self._fail_impl(msg, **kwargs)
+
+    def log(self, msg, pretty_print=False):
+        pass
 
     def acquire_token_with_username_password(self, authority, resource, username, password, client_id, tenant):
         authority_uri = authority
@@ -390,134 +614,48 @@ class AzureRMModuleBase(object):
         if tenant is not None:
             authority_uri = authority + '/' + tenant
 
+        try:
+            from adal.authentication_context import AuthenticationContext
+        except ImportError as exc:
+            self.fail("Do you have adal installed? Try `pip install adal` - {0}".format(exc))
         context = AuthenticationContext(authority_uri)
         token_response = context.acquire_token_with_username_password(resource, username, password, client_id)
 
         return AADTokenCredentials(token_response)
 
-    def check_client_version(self, client_type):
-        # Ensure Azure modules are at least 2.0.0rc5.
-        package_version = AZURE_PKG_VERSIONS.get(client_type.__name__, None)
-        if package_version is not None:
-            client_name = package_version.get('package_name')
-            try:
-                client_module = importlib.import_module(client_type.__module__)
-                client_version = client_module.VERSION
-            except RuntimeError:
-                # can't get at the module version for some reason, just fail silently...
-                return
-            expected_version = package_version.get('expected_version')
-            if Version(client_version) < Version(expected_version):
-                self.fail("Installed azure-mgmt-{0} client version is {1}. The supported version is {2}. Try "
-                          "`pip install ansible[azure]`".format(client_name, client_version, expected_version))
-
-    def exec_module(self, **kwargs):
-        self.fail("Error: {0} failed to implement exec_module method.".format(self.__class__.__name__))
-
-    def fail(self, msg, **kwargs):
+    def get_cached_credentials(self, tenant, principal, client_id, acquire):
         '''
-        Shortcut for calling module.fail()
-
-        :param msg: Error message text.
-        :param kwargs: Any key=value pairs
-        :return: None
+        Return credentials for principal, served from the on-disk token cache when it is enabled
+        (ANSIBLE_AZURE_TOKEN_CACHE) and holds a token that is not about to expire. Otherwise call
+        acquire() to authenticate against AAD and store the resulting token for later tasks.
+
+        :param tenant: AAD tenant
+        :param principal: client_id of the service principal or the AD user name
+        :param client_id: client_id to refresh the token with, None for the SDK default
+        :param acquire: callable returning fresh credentials
+        :return: credentials object
         '''
-        self.module.fail_json(msg=msg, **kwargs)
-
-    def deprecate(self, msg, version=None):
-        self.module.deprecate(msg, version)
-
-    def log(self, msg, pretty_print=False):
-        pass
-        # Use only during module development
-        # if self.debug:
-        #     log_file = open('azure_rm.log', 'a')
-        #     if pretty_print:
-        #         log_file.write(json.dumps(msg, indent=4, sort_keys=True))
-        #     else:
-        #         log_file.write(msg + u'\n')
-
-    def validate_tags(self, tags):
-        '''
-        Check if tags dictionary contains string:string pairs.
-
-        :param tags: dictionary of string:string pairs
-        :return: None
-        '''
-        if not self.facts_module:
-            if not isinstance(tags, dict):
-                self.fail("Tags must be a dictionary of string:string values.")
-            for key, value in tags.items():
-                if not isinstance(value, str):
-                    self.fail("Tags values must be strings. Found {0}:{1}".format(str(key), str(value)))
-
-    def update_tags(self, tags):
-        '''
-        Call from the module to update metadata tags. Returns tuple
-        with bool indicating if there was a change and dict of new
-        tags to assign to the object.
-
-        :param tags: metadata tags from the object
-        :return: bool, dict
-        '''
-        new_tags = copy.copy(tags) if isinstance(tags, dict) else dict()
-        changed = False
-        if isinstance(self.module.params.get('tags'), dict):
-            for key, value in self.module.params['tags'].items():
-                if not new_tags.get(key) or new_tags[key] != value:
-                    changed = True
-                    new_tags[key] = value
-            if isinstance(tags, dict):
-                for key, value in tags.items():
-                    if not self.module.params['tags'].get(key):
-                        new_tags.pop(key)
-                        changed = True
-        return changed, new_tags
-
-    def has_tags(self, obj_tags, tag_list):
-        '''
-        Used in fact modules to compare object tags to list of parameter tags. Return true if list of parameter tags
-        exists in object tags.
-
-        :param obj_tags: dictionary of tags from an Azure object.
-        :param tag_list: list of tag keys or tag key:value pairs
-        :return: bool
-        '''
-
-        if not obj_tags and tag_list:
-            return False
-
-        if not tag_list:
-            return True
-
-        matches = 0
-        result = False
-        for tag in tag_list:
-            tag_key = tag
-            tag_value = None
-            if ':' in tag:
-                tag_key, tag_value = tag.split(':')
-            if tag_value and obj_tags.get(tag_key) == tag_value:
-                matches += 1
-            elif not tag_value and obj_tags.get(tag_key):
-                matches += 1
-        if matches == len(tag_list):
-            result = True
-        return result
-
-    def get_resource_group(self, resource_group):
-        '''
-        Fetch a resource group.
-
-        :param resource_group: name of a resource group
-        :return: resource group object
-        '''
-        try:
-            return self.rm_client.resource_groups.get(resource_group)
-        except CloudError as cloud_error:
-            self.fail("Error retrieving resource group {0} - {1}".format(resource_group, cloud_error.message))
-        except Exception as exc:
-            self.fail("Error retrieving resource group {0} - {1}".format(resource_group, str(exc)))
+        if not self._token_cache:
+            return acquire()
+
+        # tokens are only shared between runs using the same authority and certificate validation
+        key = cache_key(tenant, principal, self._resource, self._cloud_environment.name, self._adfs_authority_url,
+                        self._cert_validation_mode)
+        token = self._token_cache.get(key)
+        if token:
+            self.log('Using cached token')
+            return AADTokenCredentials(token, client_id=client_id, cloud_environment=self._cloud_environment,
+                                       verify=self._cert_validation_mode == 'validate')
+
+        credentials = acquire()
+        expires_at = token_expires_at(getattr(credentials, 'token', None))
+        if expires_at:
+            try:
+                margin = float(os.environ.get(AZURE_TOKEN_REFRESH_MARGIN_ENV, AZURE_TOKEN_REFRESH_MARGIN))
+            except ValueError:
+                margin = AZURE_TOKEN_REFRESH_MARGIN
+            self._token_cache.set(key, credentials.token, expires_at=expires_at - margin)
+        return credentials
 
     def _get_profile(self, profile="default"):
         path = expanduser("~/.azure/credentials")
@@ -545,6 +683,7 @@ class AzureRMModuleBase(object):
         if not subscription_id:
             try:
                 # use the first subscription of the MSI
+                from azure.mgmt.resource.subscriptions import SubscriptionClient
                 subscription_client = SubscriptionClient(credentials)
                 subscription = next(subscription_client.subscriptions.list())
                 subscription_id = str(subscription.subscription_id)
@@ -651,6 +790,251 @@ class AzureRMModuleBase(object):
 
         return None
 
+
+class AzureRMModuleBase(object):
+    def __init__(self, derived_arg_spec, bypass_checks=False, no_log=False,
+                 check_invalid_arguments=None, mutually_exclusive=None, required_together=None,
+                 required_one_of=None, add_file_common_args=False, supports_check_mode=False,
+                 required_if=None, supports_tags=True, facts_module=False, skip_exec=False):
+
+        merged_arg_spec = dict()
+        merged_arg_spec.update(AZURE_COMMON_ARGS)
+        if supports_tags:
+            merged_arg_spec.update(AZURE_TAG_ARGS)
+        if facts_module:
+            merged_arg_spec.update(AZURE_FACTS_ARGS)
+
+        if derived_arg_spec:
+            merged_arg_spec.update(derived_arg_spec)
+
+        merged_required_if = list(AZURE_COMMON_REQUIRED_IF)
+        if required_if:
+            merged_required_if += required_if
+
+        self.module = AnsibleModule(argument_spec=merged_arg_spec,
+                                    bypass_checks=bypass_checks,
+                                    no_log=no_log,
+                                    check_invalid_arguments=check_invalid_arguments,
+                                    mutually_exclusive=mutually_exclusive,
+                                    required_together=required_together,
+                                    required_one_of=required_one_of,
+                                    add_file_common_args=add_file_common_args,
+                                    supports_check_mode=supports_check_mode,
+                                    required_if=merged_required_if)
+
+        if not HAS_PACKAGING_VERSION:
+            self.fail("Do you have packaging installed? Try `pip install packaging`"
+                      "- {0}".format(HAS_PACKAGING_VERSION_EXC))
+
+        if not HAS_MSRESTAZURE:
+            self.fail("Do you have msrestazure installed? Try `pip install msrestazure`"
+                      "- {0}".format(HAS_MSRESTAZURE_EXC))
+
+        if not HAS_AZURE:
+            self.fail("Do you have azure>={1} installed? Try `pip install ansible[azure]`"
+                      "- {0}".format(HAS_AZURE_EXC, AZURE_MIN_RELEASE))
+
+        self._network_client = None
+        self._storage_client = None
+        self._resource_client = None
+        self._compute_client = None
+        self._dns_client = None
+        self._web_client = None
+        self._containerservice_client = None
+        self._http_adapter = None
+        self._vm_sizes = dict()
+        self._image_versions = dict()
+        self._custom_images = None
+        self._blob_clients = dict()
+
+        self.check_mode = self.module.check_mode
+        self.api_profile = self.module.params.get('api_profile')
+        self.facts_module = facts_module
+        self.fields = field_tree(self.module.params.get('fields'))
+        self.poll_interval = self.module.params.get('poll_interval') or AZURE_POLL_INTERVAL
+        self.poll_timeout = self.module.params.get('poll_timeout')
+        # self.debug = self.module.params.get('debug')
+
+        # authenticate
+        self.azure_auth = AzureRMAuth(fail_impl=self.fail, **self.module.params)
+        self.credentials = self.azure_auth.credentials
+        self.azure_credentials = self.azure_auth.azure_credentials
+        self.subscription_id = self.azure_auth.subscription_id
+        self._cloud_environment = self.azure_auth._cloud_environment
+        self._cert_validation_mode = self.azure_auth._cert_validation_mode
+        self._adfs_authority_url = self.azure_auth._adfs_authority_url
+        self._resource = self.azure_auth._resource
+
+        # common parameter validation
+        if self.module.params.get('tags'):
+            self.validate_tags(self.module.params['tags'])
+
+        if not skip_exec:
+            try:
+                res = self.exec_module(**self.module.params)
+                if self.module._debug and self._http_adapter:
+                    res['azure_http_stats'] = self._http_adapter.stats()
+                self.module.exit_json(**res)
+            finally:
+                # exit_json and fail_json raise SystemExit, the pool is released on every way out
+                if self._http_adapter:
+                    self._http_adapter.release()
+
+    def import_sdk(self, module_name, class_name):
+        '''
+        Import an Azure SDK class on first use.
+
+        :param module_name: name of the SDK module, e.g. azure.mgmt.network
+        :param class_name: name of the class to return from that module
+        :return: class object
+        '''
+        try:
+            return getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as exc:
+            self.fail("Failed to import {0} from {1}. Do you have azure>={2} installed? Try `pip install ansible[azure]`"
+                      "- {3}".format(class_name, module_name, AZURE_MIN_RELEASE, exc))
+
+    def check_client_version(self, client_type):
+        # Ensure Azure modules are at least 2.0.0rc5.
+        package_version = AZURE_PKG_VERSIONS.get(client_type.__name__, None)
+        if package_version is not None:
+            client_name = package_version.get('package_name')
+            try:
+                client_module = importlib.import_module(client_type.__module__)
+                client_version = client_module.VERSION
+            except RuntimeError:
+                # can't get at the module version for some reason, just fail silently...
+                return
+            expected_version = package_version.get('expected_version')
+            if Version(client_version) < Version(expected_version):
+                self.fail("Installed azure-mgmt-{0} client version is {1}. The supported version is {2}. Try "
+                          "`pip install ansible[azure]`".format(client_name, client_version, expected_version))
+
+    def exec_module(self, **kwargs):
+        self.fail("Error: {0} failed to implement exec_module method.".format(self.__class__.__name__))
+
+    def fail(self, msg, **kwargs):
+        '''
+        Shortcut for calling module.fail()
+
+        :param msg: Error message text.
+        :param kwargs: Any key=value pairs
+        :return: None
+        '''
+        self.module.fail_json(msg=msg, **kwargs)
+
+    def deprecate(self, msg, version=None):
+        self.module.deprecate(msg, version)
+
+    def log(self, msg, pretty_print=False):
+        pass
+        # Use only during module development
+        # if self.debug:
+        #     log_file = open('azure_rm.log', 'a')
+        #     if pretty_print:
+        #         log_file.write(json.dumps(msg, indent=4, sort_keys=True))
+        #     else:
+        #         log_file.write(msg + u'\n')
+
+    def validate_tags(self, tags):
+        '''
+        Check if tags dictionary contains string:string pairs.
+
+        :param tags: dictionary of string:string pairs
+        :return: None
+        '''
+        if not self.facts_module:
+            if not isinstance(tags, dict):
+                self.fail("Tags must be a dictionary of string:string values.")
+            for key, value in tags.items():
+                if not isinstance(value, str):
+                    self.fail("Tags values must be strings. Found {0}:{1}".format(str(key), str(value)))
+
+    def update_tags(self, tags):
+        '''
+        Call from the module to update metadata tags. Returns tuple
+        with bool indicating if there was a change and dict of new
+        tags to assign to the object.
+
+        :param tags: metadata tags from the object
+        :return: bool, dict
+        '''
+        new_tags = copy.copy(tags) if isinstance(tags, dict) else dict()
+        changed = False
+        if isinstance(self.module.params.get('tags'), dict):
+            for key, value in self.module.params['tags'].items():
+                if not new_tags.get(key) or new_tags[key] != value:
+                    changed = True
+                    new_tags[key] = value
+            if isinstance(tags, dict):
+                for key, value in tags.items():
+                    if not self.module.params['tags'].get(key):
+                        new_tags.pop(key)
+                        changed = True
+        return changed, new_tags
+
+    def has_tags(self, obj_tags, tag_list):
+        '''
+        Used in fact modules to compare object tags to list of parameter tags. Return true if list of parameter tags
+        exists in object tags.
+
+        :param obj_tags: dictionary of tags from an Azure object.
+        :param tag_list: list of tag keys or tag key:value pairs
+        :return: bool
+        '''
+
+        if not obj_tags and tag_list:
+            return False
+
+        if not tag_list:
+            return True
+
+        matches = 0
+        result = False
+        for tag in tag_list:
+            tag_key = tag
+            tag_value = None
+            if ':' in tag:
+                tag_key, tag_value = tag.split(':')
+            if tag_value and obj_tags.get(tag_key) == tag_value:
+                matches += 1
+            elif not tag_value and obj_tags.get(tag_key):
+                matches += 1
+        if matches == len(tag_list):
+            result = True
+        return result
+
+    def get_tag_filter(self, tag_list):
+        '''
+        Build an ARM $filter expression from a list of parameter tags, for list APIs supporting tagName and
+        tagValue filters such as resource groups and generic resources. ARM filters on a single tag only,
+        so None is returned for other lists. Results should still be checked with has_tags.
+
+        :param tag_list: list of tag keys or tag key:value pairs
+        :return: filter expression or None
+        '''
+        if not tag_list or len(tag_list) != 1:
+            return None
+        # quotes are doubled in OData string literals
+        tag_key, _, tag_value = tag_list[0].replace("'", "''").partition(':')
+        if tag_value:
+            return "tagName eq '{0}' and tagValue eq '{1}'".format(tag_key, tag_value)
+        return "tagName eq '{0}'".format(tag_key)
+
+    def get_resource_group(self, resource_group):
+        '''
+        Fetch a resource group.
+
+        :param resource_group: name of a resource group
+        :return: resource group object
+        '''
+        try:
+            return self.rm_client.resource_groups.get(resource_group)
+        except CloudError as cloud_error:
+            self.fail("Error retrieving resource group {0} - {1}".format(resource_group, cloud_error.message))
+        except Exception as exc:
+            self.fail("Error retrieving resource group {0} - {1}".format(resource_group, str(exc)))
+
     def parse_resource_to_dict(self, resource):
         '''
         Return a dict of the give resource, which contains name and resource group.
@@ -662,45 +1046,136 @@ class AzureRMModuleBase(object):
         resource_dict['subscription_id'] = resource_dict.get('subscription_id', self.subscription_id)
         return resource_dict
 
-    def serialize_obj(self, obj, class_name, enum_modules=None):
+    def serialize_obj(self, obj, class_name, enum_modules=None, apply_fields=True):
         '''
-        Return a JSON representation of an Azure object.
+        Return a JSON representation of an Azure object. In facts modules called with fields,
+        only those fields are serialized.
 
         :param obj: Azure object
         :param class_name: Name of the object's class
         :param enum_modules: List of module names to build enum dependencies from.
+        :param apply_fields: Restrict the result to the fields module parameter.
         :return: serialized result
         '''
-        enum_modules = [] if enum_modules is None else enum_modules
+        serializer = self.get_serializer(enum_modules)
+        if apply_fields and self.fields:
+            return serialize_fields(serializer, obj, self.fields)
+        return serializer.body(obj, class_name, keep_readonly=True)
+
+    def get_serializer(self, enum_modules=None):
+        '''
+        Return a Serializer knowing the classes of the given modules. Serializers are cached
+        per list of modules for the lifetime of the process, as building the class map is costly.
 
-        dependencies = dict()
-        if enum_modules:
-            for module_name in enum_modules:
+        :param enum_modules: List of module names to build enum dependencies from.
+        :return: Serializer
+        '''
+        key = tuple(enum_modules or [])
+        serializer = _serializer_cache.get(key)
+        if serializer is None:
+            dependencies = dict()
+            for module_name in key:
                 mod = importlib.import_module(module_name)
                 for mod_class_name, mod_class_obj in inspect.getmembers(mod, predicate=inspect.isclass):
                     dependencies[mod_class_name] = mod_class_obj
             self.log("dependencies: ")
             self.log(str(dependencies))
-        serializer = Serializer(classes=dependencies)
-        return serializer.body(obj, class_name, keep_readonly=True)
+            serializer = Serializer(classes=dependencies)
+            _serializer_cache[key] = serializer
+        return serializer
 
-    def get_poller_result(self, poller, wait=5):
+    def get_poller_result(self, poller, wait=None):
         '''
-        Consistent method of waiting on and retrieving results from Azure's long poller
+        Consistent method of waiting on and retrieving results from Azure's long poller.
+
+        The operation status is checked after poll_interval seconds first, then with exponential
+        backoff and jitter. The SDK poller follows Azure-AsyncOperation/Location and honours
+        Retry-After, which takes precedence over the computed interval.
 
         :param poller Azure poller object
+        :param wait upper bound of the interval between status checks, in seconds
         :return object resulting from the original request
         '''
+        max_interval = wait or AZURE_POLL_MAX_INTERVAL
+        deadline = time.time() + self.poll_timeout if self.poll_timeout else None
         try:
-            delay = wait
+            delay = min(self.poll_interval, max_interval)
             while not poller.done():
+                if deadline is not None and time.time() >= deadline:
+                    raise Exception("Timed out after {0} seconds waiting for the operation to complete".format(self.poll_timeout))
+                set_poller_interval(poller, delay)
                 self.log("Waiting for {0} sec".format(delay))
-                poller.wait(timeout=delay)
+                poller.wait(timeout=delay if deadline is None else max(min(delay, deadline - time.time()), 0.1))
+                delay = next_poll_delay(delay, max_interval)
             return poller.result()
         except Exception as exc:
             self.log(str(exc))
             raise
 
+    def wait_until_gone(self, exists, name, timeout=None):
+        '''
+        Wait until a deleted resource disappears, for resources that are still returned for a while
+        after their delete operation completed. exists() is called right away, then after poll_interval
+        seconds with exponential backoff and jitter. A CloudError with status 404 counts as gone.
+
+        :param exists: callable returning a truthy value while the resource exists
+        :param name: resource name for the error message
+        :param timeout: seconds to wait before failing, default poll_timeout or 30 minutes
+        :return: None
+        '''
+        timeout = timeout or self.poll_timeout or AZURE_DELETE_TIMEOUT
+        deadline = time.time() + timeout
+        delay = self.poll_interval
+        while True:
+            try:
+                if not exists():
+                    return
+            except CloudError as exc:
+                if exc.status_code == 404:
+                    return
+                raise
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                self.fail("Timed out after {0} seconds waiting for {1} to be deleted".format(timeout, name))
+            # the last wait ends at the deadline, followed by a final check
+            self.log("Waiting for {0} sec".format(min(delay, remaining)))
+            time.sleep(min(delay, remaining))
+            delay = next_poll_delay(delay)
+
+    def get_operation_handle(self, poller):
+        '''
+        Describe a running long running operation so that it can be polled later,
+        e.g. with azure_rm_operation_facts.
+
+        :param poller Azure poller object
+        :return dict with id, method, api_version and status_url of the operation
+        '''
+        response = getattr(poller, '_response', None)
+        response = getattr(response, 'response', response)
+        if response is None or getattr(response, 'request', None) is None:
+            return dict(id=None, method=None, api_version=None, status_url=None)
+        url = urlparse.urlparse(response.request.url)
+        headers = response.headers or dict()
+        return dict(
+            id=url.path,
+            method=response.request.method,
+            api_version=urlparse.parse_qs(url.query).get('api-version', [None])[0],
+            status_url=headers.get('Azure-AsyncOperation') or headers.get('Location')
+        )
+
+    def exit_with_operation(self, poller, **kwargs):
+        '''
+        Exit the module right away with a handle to the running operation, used by modules called with wait=false.
+        The results gathered so far in self.results are returned as well.
+
+        :param poller Azure poller object
+        :param kwargs additional results, override self.results
+        '''
+        result = dict(getattr(self, 'results', None) or dict(), **kwargs)
+        result['changed'] = True
+        result['operation'] = self.get_operation_handle(poller)
+        self.module.exit_json(**result)
+
     def check_provisioning_state(self, azure_object, requested_state='present'):
         '''
         Check an Azure object's provisioning state. If something did not complete the provisioning
@@ -736,26 +1211,268 @@ class AzureRMModuleBase(object):
                 self.fail("Error {0} has a provisioning state of {1}. Expecting state to be {2}.".format(
                     azure_object.name, azure_object.provisioning_state, AZURE_SUCCESS_STATE))
 
+    def get_vm_sizes(self, location, refresh=False):
+        '''
+        Return the catalogue of virtual machine sizes available in a location, as a dict of size name
+        to dict with number_of_cores, memory_in_mb, max_data_disk_count, os_disk_size_in_mb and
+        resource_disk_size_in_mb. The catalogue is cached on the controller per subscription and location
+        for ANSIBLE_AZURE_VM_SIZE_CACHE_TTL seconds, 0 disables the cache.
+
+        :param location: Azure location
+        :param refresh: bypass the cache
+        :return: tuple of dict and whether the catalogue was read from the cache
+        '''
+        location = normalize_location_name(location)
+        if not refresh and location in self._vm_sizes:
+            return self._vm_sizes[location]
+
+        ttl = cache_ttl(AZURE_VM_SIZE_CACHE_TTL_ENV, AZURE_VM_SIZE_CACHE_TTL)
+        cache = AzureRMFileCache('vm_sizes') if ttl > 0 else None
+        key = cache_key(self.subscription_id, location)
+
+        sizes = cache.get(key) if cache and not refresh else None
+        cached = sizes is not None
+        if sizes is None:
+            try:
+                sizes = dict((size.name, dict(number_of_cores=size.number_of_cores,
+                                              memory_in_mb=size.memory_in_mb,
+                                              max_data_disk_count=size.max_data_disk_count,
+                                              os_disk_size_in_mb=size.os_disk_size_in_mb,
+                                              resource_disk_size_in_mb=size.resource_disk_size_in_mb))
+                             for size in self.compute_client.virtual_machine_sizes.list(location))
+            except Exception as exc:
+                self.fail("Error retrieving available machine sizes - {0}".format(str(exc)))
+            if cache:
+                cache.set(key, sizes, ttl=ttl)
+        self._vm_sizes[location] = (sizes, cached)
+        return sizes, cached
+
+    def get_vm_size(self, location, name):
+        '''
+        Look up a virtual machine size in the catalogue of a location, see get_vm_sizes.
+        A catalogue read from the cache is refreshed once if it does not know the size.
+
+        :param location: Azure location
+        :param name: name of the size, e.g. Standard_D2_v2
+        :return: dict or None if the size is not available
+        '''
+        sizes, cached = self.get_vm_sizes(location)
+        size = sizes.get(name)
+        if size is None and cached:
+            size = self.get_vm_sizes(location, refresh=True)[0].get(name)
+        return size
+
+    def check_data_disk_count(self, location, vm_size, data_disks):
+        '''
+        Fail if a virtual machine size does not support the requested number of data disks.
+
+        :param location: Azure location
+        :param vm_size: name of the size
+        :param data_disks: list of requested data disks
+        '''
+        size = self.get_vm_size(location, vm_size)
+        max_data_disk_count = size['max_data_disk_count'] if size else None
+        if max_data_disk_count is not None and len(data_disks) > max_data_disk_count:
+            self.fail("Parameter error: vm_size {0} supports at most {1} data disks, {2} requested.".format(
+                vm_size, max_data_disk_count, len(data_disks)
+            ))
+
+    def get_image_versions(self, location, publisher, offer, sku, refresh=False):
+        '''
+        Return the versions of a marketplace image, sorted from oldest to newest. Versions are
+        cached on the controller per location, publisher, offer and sku for
+        ANSIBLE_AZURE_IMAGE_CACHE_TTL seconds, 0 disables the cache.
+
+        :return: tuple of list of version names and whether the list was read from the cache
+        '''
+        location = normalize_location_name(location)
+        image = (location, publisher.lower(), offer.lower(), sku.lower())
+        if not refresh and image in self._image_versions:
+            return self._image_versions[image]
+
+        ttl = cache_ttl(AZURE_IMAGE_CACHE_TTL_ENV, AZURE_IMAGE_CACHE_TTL)
+        cache = AzureRMFileCache('image_versions') if ttl > 0 else None
+        key = cache_key(self.subscription_id, location, publisher, offer, sku)
+
+        versions = cache.get(key) if cache and not refresh else None
+        cached = versions is not None
+        if versions is None:
+            try:
+                images = self.compute_client.virtual_machine_images.list(location, publisher, offer, sku)
+            except Exception as exc:
+                self.fail("Error fetching image {0} {1} {2} - {3}".format(publisher, offer, sku, str(exc)))
+            versions = sorted([image.name for image in images or []], key=image_version_key)
+            if cache and versions:
+                cache.set(key, versions, ttl=ttl)
+        self._image_versions[image] = (versions, cached)
+        return versions, cached
+
+    def resolve_image_version(self, location, publisher, offer, sku, version='latest'):
+        '''
+        Resolve a marketplace image version, 'latest' being the highest version number.
+        A version list read from the cache is refreshed once if it does not contain the requested version.
+
+        :return: version name, or None if the image or version does not exist
+        '''
+        versions, cached = self.get_image_versions(location, publisher, offer, sku)
+        if cached and not (versions if version == 'latest' else version in versions):
+            versions = self.get_image_versions(location, publisher, offer, sku, refresh=True)[0]
+        if version == 'latest':
+            return versions[-1] if versions else None
+        return version if version in versions else None
+
+    def get_custom_images(self, refresh=False):
+        '''
+        Return an index of the custom images of the subscription, as a dict of image name to list of
+        image ids. The index is built from one paged list of all images and cached on the controller for
+        ANSIBLE_AZURE_CUSTOM_IMAGE_CACHE_TTL seconds, 0 disables the cache.
+
+        :param refresh: rebuild the index
+        :return: tuple of dict and whether the index was read from the cache
+        '''
+        if not refresh and self._custom_images is not None:
+            return self._custom_images, False
+
+        ttl = cache_ttl(AZURE_CUSTOM_IMAGE_CACHE_TTL_ENV, AZURE_CUSTOM_IMAGE_CACHE_TTL)
+        cache = AzureRMFileCache('custom_images') if ttl > 0 else None
+        key = cache_key(self.subscription_id)
+
+        index = cache.get(key) if cache and not refresh else None
+        cached = index is not None
+        if index is None:
+            index = dict()
+            try:
+                for image in self.compute_client.images.list():
+                    index.setdefault(image.name, []).append(image.id)
+            except Exception as exc:
+                self.fail("Error fetching custom images from subscription - {0}".format(str(exc)))
+            if cache:
+                cache.set(key, index, ttl=ttl)
+        self._custom_images = index
+        return index, cached
+
+    def get_custom_image_id(self, name, resource_group=None):
+        '''
+        Look up the id of a custom image. With a resource group the image is fetched directly, otherwise
+        it is looked up in the index of get_custom_images. A cached index is rebuilt once if it does not
+        know the image or the image it points to no longer exists.
+
+        :return: image id, or None if the image does not exist
+        '''
+        if resource_group:
+            image = self.get_custom_image(resource_group, name)
+            return image.id if image else None
+
+        index, cached = self.get_custom_images()
+        image_ids = index.get(name)
+        if cached and image_ids:
+            image = self.get_custom_image(parse_resource_id(image_ids[0])['resource_group'], name)
+            if image is None:
+                image_ids = None
+        if cached and not image_ids:
+            index, cached = self.get_custom_images(refresh=True)
+            image_ids = index.get(name)
+        return image_ids[0] if image_ids else None
+
+    def get_custom_image(self, resource_group, name):
+        try:
+            return self.compute_client.images.get(resource_group, name)
+        except CloudError as exc:
+            if exc.status_code == 404:
+                return None
+            self.fail("Error fetching custom image {0} - {1}".format(name, str(exc)))
+
     def get_blob_client(self, resource_group_name, storage_account_name, storage_blob_type='block'):
-        keys = dict()
+        '''
+        Return a blob service client for a storage account. Clients are reused for the rest of the module run.
+
+        :param resource_group_name: resource group of the storage account
+        :param storage_account_name: name of the storage account
+        :param storage_blob_type: 'block' or 'page'
+        :return: BlockBlobService or PageBlobService
+        '''
         try:
-            # Get keys from the storage account
-            self.log('Getting keys')
-            account_keys = self.storage_client.storage_accounts.list_keys(resource_group_name, storage_account_name)
+            return self.get_blob_service(resource_group_name, storage_account_name, storage_blob_type)
         except Exception as exc:
-            self.fail("Error getting keys for account {0} - {1}".format(storage_account_name, str(exc)))
+            self.fail(str(exc))
+
+    def get_blob_service(self, resource_group_name, storage_account_name, storage_blob_type='block'):
+        '''
+        Same as get_blob_client, but raises an Exception instead of failing the module, for callers
+        that report errors per resource.
+        '''
+        client_key = (resource_group_name.lower(), storage_account_name.lower(), storage_blob_type)
+        if client_key in self._blob_clients:
+            return self._blob_clients[client_key]
+
+        account_key, cached = self.load_storage_account_key(resource_group_name, storage_account_name)
+        client = self.create_blob_service(storage_account_name, account_key, storage_blob_type)
+        if cached:
+            # a cached key may have been rotated since, check it once and fetch the keys again if it is rejected
+            AzureHttpError = self.import_sdk('azure.common', 'AzureHttpError')
+            try:
+                client.get_blob_service_properties()
+            except AzureHttpError as exc:
+                if exc.status_code != 403:
+                    raise Exception("Error accessing storage account {0} - {1}".format(storage_account_name, str(exc)))
+                self.log('Cached storage account key was rejected')
+                account_key, cached = self.load_storage_account_key(resource_group_name, storage_account_name, refresh=True)
+                client = self.create_blob_service(storage_account_name, account_key, storage_blob_type)
+        self._blob_clients[client_key] = client
+        return client
 
+    def create_blob_service(self, storage_account_name, account_key, storage_blob_type):
+        CloudStorageAccount = self.import_sdk('azure.storage.cloudstorageaccount', 'CloudStorageAccount')
         try:
             self.log('Create blob service')
             if storage_blob_type == 'page':
-                return CloudStorageAccount(storage_account_name, account_keys.keys[0].value).create_page_blob_service()
+                return CloudStorageAccount(storage_account_name, account_key).create_page_blob_service()
             elif storage_blob_type == 'block':
-                return CloudStorageAccount(storage_account_name, account_keys.keys[0].value).create_block_blob_service()
-            else:
-                raise Exception("Invalid storage blob type defined.")
+                return CloudStorageAccount(storage_account_name, account_key).create_block_blob_service()
+            raise Exception("Invalid storage blob type defined.")
         except Exception as exc:
-            self.fail("Error creating blob service client for storage account {0} - {1}".format(storage_account_name,
-                                                                                                str(exc)))
+            raise Exception("Error creating blob service client for storage account {0} - {1}".format(storage_account_name,
+                                                                                                      str(exc)))
+
+    def get_storage_account_key(self, resource_group_name, storage_account_name):
+        '''
+        Return the first key of a storage account. If ANSIBLE_AZURE_STORAGE_KEY_CACHE_SECRET is set, keys are
+        cached on the controller encrypted with that secret, for ANSIBLE_AZURE_STORAGE_KEY_CACHE_TTL seconds.
+        Raises an Exception if the keys cannot be listed.
+        '''
+        return self.load_storage_account_key(resource_group_name, storage_account_name)[0]
+
+    def load_storage_account_key(self, resource_group_name, storage_account_name, refresh=False):
+        '''
+        Same as get_storage_account_key, but returns a tuple of the key and whether it was served from the cache.
+        With refresh the cached key is dropped and the keys are listed again.
+        '''
+        ttl = cache_ttl(AZURE_STORAGE_KEY_CACHE_TTL_ENV, AZURE_STORAGE_KEY_CACHE_TTL)
+        cipher = storage_key_cipher() if ttl > 0 else None
+        cache = AzureRMFileCache('storage_keys') if cipher else None
+        key = cache_key(self.subscription_id, resource_group_name, storage_account_name, self._cloud_environment.name)
+        if cache and refresh:
+            cache.delete(key)
+        elif cache:
+            encrypted = cache.get(key)
+            if encrypted:
+                try:
+                    return cipher.decrypt(encrypted.encode('utf-8'), ttl=ttl).decode('utf-8'), True
+                except Exception:
+                    # encrypted with another secret, the key is fetched again
+                    self.log('Ignoring cached storage account key')
+
+        try:
+            # Get keys from the storage account
+            self.log('Getting keys')
+            account_keys = self.storage_client.storage_accounts.list_keys(resource_group_name, storage_account_name)
+        except Exception as exc:
+            raise Exception("Error getting keys for account {0} - {1}".format(storage_account_name, str(exc)))
+
+        account_key = account_keys.keys[0].value
+        if cache:
+            cache.set(key, cipher.encrypt(account_key.encode('utf-8')).decode('utf-8'), ttl=ttl)
+        return account_key, False
 
     def create_default_pip(self, resource_group, location, public_ip_name, allocation_method='Dynamic'):
         '''
@@ -894,9 +1611,22 @@ class AzureRMModuleBase(object):
 
         return self.get_poller_result(poller)
 
-    @staticmethod
-    def _validation_ignore_callback(session, global_config, local_config, **kwargs):
-        session.verify = False
+    @property
+    def http_adapter(self):
+        if not self._http_adapter:
+            try:
+                pool_size = int(os.environ.get(AZURE_HTTP_POOL_SIZE_ENV, AZURE_HTTP_POOL_SIZE))
+            except ValueError:
+                pool_size = AZURE_HTTP_POOL_SIZE
+            self._http_adapter = AzureRMSharedHTTPAdapter(pool_size)
+        return self._http_adapter
+
+    def _session_configuration_callback(self, session, global_config, local_config, **kwargs):
+        session.mount('https://', self.http_adapter)
+        session.mount('http://', self.http_adapter)
+        if self._cert_validation_mode == 'ignore':
+            session.verify = False
+        return kwargs
 
     def get_api_profile(self, client_type_name, api_profile_name):
         profile_all_clients = AZURE_API_PROFILES.get(api_profile_name)
@@ -967,8 +1697,13 @@ class AzureRMModuleBase(object):
         if VSCODEEXT_USER_AGENT_KEY in os.environ:
             client.config.add_user_agent(os.environ[VSCODEEXT_USER_AGENT_KEY])
 
-        if self._cert_validation_mode == 'ignore':
-            client.config.session_configuration_callback = self._validation_ignore_callback
+        # first status check of long running operations, see get_poller_result
+        client.config.long_running_operation_timeout = self.poll_interval
+
+        # share one connection pool between all clients of this module
+        client.config.session_configuration_callback = self._session_configuration_callback
+        if hasattr(client.config, 'keep_alive'):
+            client.config.keep_alive = env_flag(AZURE_HTTP_KEEP_ALIVE_ENV, True)
 
         return client
 
@@ -976,7 +1711,8 @@ class AzureRMModuleBase(object):
     def storage_client(self):
         self.log('Getting storage client...')
         if not self._storage_client:
-            self._storage_client = self.get_mgmt_svc_client(StorageManagementClient,
+            client_type = self.import_sdk('azure.mgmt.storage', 'StorageManagementClient')
+            self._storage_client = self.get_mgmt_svc_client(client_type,
                                                             base_url=self._cloud_environment.endpoints.resource_manager,
                                                             api_version='2017-10-01')
         return self._storage_client
@@ -984,13 +1720,14 @@ class AzureRMModuleBase(object):
     @property
     def storage_models(self):
         self.log('Getting storage models...')
-        return StorageManagementClient.models("2017-10-01")
+        return self.import_sdk('azure.mgmt.storage', 'StorageManagementClient').models("2017-10-01")
 
     @property
     def network_client(self):
         self.log('Getting network client')
         if not self._network_client:
-            self._network_client = self.get_mgmt_svc_client(NetworkManagementClient,
+            client_type = self.import_sdk('azure.mgmt.network', 'NetworkManagementClient')
+            self._network_client = self.get_mgmt_svc_client(client_type,
                                                             base_url=self._cloud_environment.endpoints.resource_manager,
                                                             api_version='2017-11-01')
         return self._network_client
@@ -998,13 +1735,14 @@ class AzureRMModuleBase(object):
     @property
     def network_models(self):
         self.log("Getting network models...")
-        return NetworkManagementClient.models("2017-11-01")
+        return self.import_sdk('azure.mgmt.network', 'NetworkManagementClient').models("2017-11-01")
 
     @property
     def rm_client(self):
         self.log('Getting resource manager client')
         if not self._resource_client:
-            self._resource_client = self.get_mgmt_svc_client(ResourceManagementClient,
+            client_type = self.import_sdk('azure.mgmt.resource.resources', 'ResourceManagementClient')
+            self._resource_client = self.get_mgmt_svc_client(client_type,
                                                              base_url=self._cloud_environment.endpoints.resource_manager,
                                                              api_version='2017-05-10')
         return self._resource_client
@@ -1012,13 +1750,14 @@ class AzureRMModuleBase(object):
     @property
     def rm_models(self):
         self.log("Getting resource manager models")
-        return ResourceManagementClient.models("2017-05-10")
+        return self.import_sdk('azure.mgmt.resource.resources', 'ResourceManagementClient').models("2017-05-10")
 
     @property
     def compute_client(self):
         self.log('Getting compute client')
         if not self._compute_client:
-            self._compute_client = self.get_mgmt_svc_client(ComputeManagementClient,
+            client_type = self.import_sdk('azure.mgmt.compute', 'ComputeManagementClient')
+            self._compute_client = self.get_mgmt_svc_client(client_type,
                                                             base_url=self._cloud_environment.endpoints.resource_manager,
                                                             api_version='2017-03-30')
         return self._compute_client
@@ -1026,13 +1765,14 @@ class AzureRMModuleBase(object):
     @property
     def compute_models(self):
         self.log("Getting compute models")
-        return ComputeManagementClient.models("2017-03-30")
+        return self.import_sdk('azure.mgmt.compute', 'ComputeManagementClient').models("2017-03-30")
 
     @property
     def dns_client(self):
         self.log('Getting dns client')
         if not self._dns_client:
-            self._dns_client = self.get_mgmt_svc_client(DnsManagementClient,
+            client_type = self.import_sdk('azure.mgmt.dns', 'DnsManagementClient')
+            self._dns_client = self.get_mgmt_svc_client(client_type,
                                                         base_url=self._cloud_environment.endpoints.resource_manager)
         return self._dns_client
 
@@ -1040,7 +1780,8 @@ class AzureRMModuleBase(object):
     def web_client(self):
         self.log('Getting web client')
         if not self._web_client:
-            self._web_client = self.get_mgmt_svc_client(WebSiteManagementClient,
+            client_type = self.import_sdk('azure.mgmt.web', 'WebSiteManagementClient')
+            self._web_client = self.get_mgmt_svc_client(client_type,
                                                         base_url=self._cloud_environment.endpoints.resource_manager)
         return self._web_client
 
@@ -1048,6 +1789,7 @@ class AzureRMModuleBase(object):
     def containerservice_client(self):
         self.log('Getting container service client')
         if not self._containerservice_client:
-            self._containerservice_client = self.get_mgmt_svc_client(ContainerServiceClient,
+            client_type = self.import_sdk('azure.mgmt.containerservice', 'ContainerServiceClient')
+            self._containerservice_client = self.get_mgmt_svc_client(client_type,
                                                                      base_url=self._cloud_environment.endpoints.resource_manager)
         return self._containerservice_client
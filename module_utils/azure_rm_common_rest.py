@@ -2,6 +2,12 @@
 #
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+import sys
+import threading
+
+from ansible.module_utils.six import reraise
+from ansible.module_utils.six.moves import queue
+
 try:
     from msrestazure.azure_exceptions import CloudError
     from msrestazure.azure_configuration import AzureConfiguration
@@ -68,3 +74,65 @@ class GenericRestClient(object):
             raise exp
 
         return response
+
+    def query_pages(self, url, query_parameters, header_parameters, expected_status_codes, prefetch=0):
+        '''
+        Iterate over the decoded pages of a list query, following nextLink until the last page.
+        A 404 yields no pages.
+
+        With prefetch > 0 pages are fetched on a worker thread, so page N+1 is being downloaded
+        while the caller processes page N. At most prefetch decoded pages are buffered.
+        '''
+        pages = self._iter_pages(url, query_parameters, header_parameters, expected_status_codes)
+        if prefetch > 0:
+            return self._prefetch_pages(pages, prefetch)
+        return pages
+
+    def _iter_pages(self, url, query_parameters, header_parameters, expected_status_codes):
+        while url:
+            response = self.query(url, 'GET', query_parameters, header_parameters, None, expected_status_codes)
+            if response.status_code == 404:
+                return
+            page = json.loads(response.text)
+            response = None
+            yield page
+            url = page.get('nextLink') if isinstance(page, dict) else None
+            # nextLink already carries api-version and the continuation token
+            query_parameters = {}
+
+    def _prefetch_pages(self, pages, prefetch):
+        buffer = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item):
+            # give up when the consumer went away, instead of blocking forever on a full buffer
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch():
+            try:
+                for page in pages:
+                    if not put(('page', page)):
+                        return
+                put(('done', None))
+            except Exception:
+                put(('error', sys.exc_info()))
+
+        worker = threading.Thread(target=fetch)
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                kind, item = buffer.get()
+                if kind == 'done':
+                    return
+                if kind == 'error':
+                    reraise(*item)
+                yield item
+        finally:
+            stop.set()
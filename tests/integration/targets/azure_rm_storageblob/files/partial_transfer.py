@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+'''
+Leave a transfer of azure_rm_storageblob half done, so that the module has something to resume.
+
+partial_transfer.py upload ACCOUNT KEY CONTAINER BLOB SRC BLOCK_SIZE
+    puts the first block of SRC as an uncommitted block of BLOB, using the block ids of the module
+partial_transfer.py download ACCOUNT KEY CONTAINER BLOB DEST BLOCK_SIZE
+    writes the first block of BLOB to DEST.partial and the ETag of BLOB to DEST.partial.json
+'''
+
+import hashlib
+import json
+import os
+import sys
+
+from azure.storage.blob import BlockBlobService
+
+MB = 1024 * 1024
+
+
+def main():
+    mode, account, key, container, blob, path, block_size = sys.argv[1:8]
+    block_size = int(block_size) * MB
+    client = BlockBlobService(account_name=account, account_key=key)
+
+    if mode == 'upload':
+        size = os.path.getsize(path)
+        fingerprint = hashlib.md5('{0}:{1}:{2}'.format(size, os.path.getmtime(path), block_size).encode('utf-8')).hexdigest()[:16]
+        with open(path, 'rb') as src:
+            data = src.read(block_size)
+        client.put_block(container, blob, data, '{0}-{1:06d}'.format(fingerprint, 0))
+    elif mode == 'download':
+        etag = client.get_blob_properties(container, blob).properties.etag
+        data = client.get_blob_to_bytes(container, blob, start_range=0, end_range=block_size - 1).content
+        with open(path + '.partial', 'wb') as partial:
+            partial.write(data)
+        with open(path + '.partial.json', 'w') as state_file:
+            json.dump(dict(etag=etag), state_file)
+    else:
+        sys.exit('unknown mode {0}'.format(mode))
+
+
+if __name__ == '__main__':
+    main()